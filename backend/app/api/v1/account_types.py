@@ -3,7 +3,7 @@ Account Types API endpoints for multi-type account management
 Handles Sponsored Ads, DSP, and AMC account endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timezone
 import structlog
@@ -116,11 +116,13 @@ async def get_sponsored_ads_accounts(
             "account_type", "advertising"
         ).execute()
 
-        return {
+        # Rows come straight from our own table: serialize them directly
+        # instead of re-validating against response_model
+        return ORJSONResponse({
             "accounts": accounts,
             "total": count_result.count if count_result else len(accounts),
             "has_more": len(accounts) == limit
-        }
+        })
 
     except Exception as e:
         logger.error(
@@ -208,12 +210,12 @@ async def get_dsp_advertisers(
             "account_type", "dsp"
         ).execute()
 
-        return {
+        return ORJSONResponse({
             "accounts": accounts,
             "total": count_result.count if count_result else len(accounts),
             "has_more": len(accounts) == limit,
             "access_denied": access_denied
-        }
+        })
 
     except Exception as e:
         logger.error(
@@ -318,11 +320,11 @@ async def get_amc_instances(
 
             instances.append(instance)
 
-        return {
+        return ORJSONResponse({
             "instances": instances,
             "total": len(instances),
             "access_denied": access_denied
-        }
+        })
 
     except Exception as e:
         logger.error(
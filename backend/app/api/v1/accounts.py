@@ -9,6 +9,7 @@ import structlog
 from pydantic import BaseModel, Field
 from uuid import uuid4
 
+from app.config import settings
 from app.middleware.clerk_auth import RequireAuth, get_user_context
 from app.services.account_service import account_service
 from app.services.amazon_oauth_service import amazon_oauth_service
@@ -154,8 +155,8 @@ async def refresh_token_if_needed(user_id: str, token_data: Dict, supabase) -> D
     expires_at = datetime.fromisoformat(token_data["expires_at"].replace('Z', '+00:00'))
     now = datetime.now(timezone.utc)
     
-    # Refresh if expired or expiring in next 5 minutes
-    if expires_at <= now + timedelta(minutes=5):
+    # Refresh if expired or expiring within the refresh buffer
+    if expires_at <= now + timedelta(seconds=settings.token_refresh_buffer):
         try:
             # Refresh the token
             new_tokens = await amazon_oauth_service.refresh_access_token(
@@ -229,9 +230,10 @@ async def get_sponsored_ads_accounts(
         accounts = []
         if result.data:
             for acc in result.data:
-                account_dict = AmazonAccount.from_dict(acc).to_dict()
+                account = AmazonAccount.from_dict(acc)
+                account_dict = account.to_dict()
                 # Add marketplace name
-                account_dict["marketplace_name"] = AmazonAccount.from_dict(acc).marketplace_name
+                account_dict["marketplace_name"] = account.marketplace_name
                 accounts.append(account_dict)
 
         logger.info(f"Retrieved {len(accounts)} sponsored ads accounts from database for user {user_id}")
@@ -280,9 +282,10 @@ async def get_dsp_advertisers(
         accounts = []
         if result.data:
             for acc in result.data:
-                account_dict = AmazonAccount.from_dict(acc).to_dict()
+                account = AmazonAccount.from_dict(acc)
+                account_dict = account.to_dict()
                 # Add marketplace name
-                account_dict["marketplace_name"] = AmazonAccount.from_dict(acc).marketplace_name
+                account_dict["marketplace_name"] = account.marketplace_name
                 accounts.append(account_dict)
 
         logger.info(f"Retrieved {len(accounts)} DSP advertisers from database for user {user_id}")
@@ -331,9 +334,10 @@ async def get_amc_accounts(
         instances = []
         if result.data:
             for acc in result.data:
-                account_dict = AmazonAccount.from_dict(acc).to_dict()
+                account = AmazonAccount.from_dict(acc)
+                account_dict = account.to_dict()
                 # Add marketplace name
-                account_dict["marketplace_name"] = AmazonAccount.from_dict(acc).marketplace_name
+                account_dict["marketplace_name"] = account.marketplace_name
                 instances.append(account_dict)
 
         logger.info(f"Retrieved {len(instances)} AMC accounts from database for user {user_id}")
@@ -382,9 +386,10 @@ async def get_amc_instances(
         instances = []
         if result.data:
             for acc in result.data:
-                account_dict = AmazonAccount.from_dict(acc).to_dict()
+                account = AmazonAccount.from_dict(acc)
+                account_dict = account.to_dict()
                 # Add marketplace name
-                account_dict["marketplace_name"] = AmazonAccount.from_dict(acc).marketplace_name
+                account_dict["marketplace_name"] = account.marketplace_name
                 instances.append(account_dict)
 
         logger.info(f"Retrieved {len(instances)} AMC instances from database for user {user_id}")
@@ -798,9 +803,11 @@ async def list_amazon_ads_accounts(
         token_data = await refresh_token_if_needed(user_id, token_data, supabase)
         
         # Call Amazon Account Management API with pagination
+        # Listed accounts are written back below, so bypass the cache
         response = await account_service.list_ads_accounts(
             token_data["access_token"],
-            next_token=next_token
+            next_token=next_token,
+            use_cache=False
         )
         accounts = response.get("adsAccounts", [])
 
@@ -954,8 +961,8 @@ async def list_amazon_profiles(
         # Refresh token if needed
         token_data = await refresh_token_if_needed(user_id, token_data, supabase)
         
-        # Call Amazon API to list profiles
-        profiles = await account_service.list_profiles(token_data["access_token"])
+        # Call Amazon API to list profiles; these are stored below, so bypass the cache
+        profiles = await account_service.list_profiles(token_data["access_token"], use_cache=False)
         
         # Transform Amazon API response to our schema
         response_profiles = []
@@ -1092,9 +1099,10 @@ async def list_accounts(
 
         accounts = []
         for acc in result.data:
-            account_dict = AmazonAccount.from_dict(acc).to_dict()
+            account = AmazonAccount.from_dict(acc)
+            account_dict = account.to_dict()
             # Add marketplace name
-            account_dict["marketplace_name"] = AmazonAccount.from_dict(acc).marketplace_name
+            account_dict["marketplace_name"] = account.marketplace_name
             # Add token expiry info for status determination
             account_dict["token_expires_at"] = token_expires_at
             accounts.append(account_dict)
@@ -1534,7 +1542,8 @@ async def batch_operations(
                         if profile_id:
                             profile = await account_service.get_profile(
                                 token_data["access_token"],
-                                str(profile_id)
+                                str(profile_id),
+                                use_cache=False
                             )
                             
                             # Update account data
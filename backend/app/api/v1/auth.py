@@ -4,7 +4,7 @@ OAuth authentication endpoints
 from fastapi import APIRouter, Query, Header, HTTPException, Depends
 from fastapi.responses import JSONResponse, RedirectResponse
 from typing import Optional, Dict, Any
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 import structlog
 
 from app.config import settings
@@ -560,8 +560,10 @@ async def list_profiles(
         expires_at = datetime.fromisoformat(
             tokens["expires_at"].replace("Z", "+00:00")
         )
-        if expires_at <= datetime.now(timezone.utc):
-            # Token expired, try to refresh
+        refresh_at = datetime.now(timezone.utc) + timedelta(seconds=settings.token_refresh_buffer)
+        if expires_at <= refresh_at:
+            # Token expired or about to; refresh now rather than burn a
+            # profiles call on a 401
             try:
                 new_token_data = await oauth_client.refresh_access_token(tokens["refresh_token"])
                 tokens = await token_service.update_tokens(tokens["id"], new_token_data)
@@ -3,9 +3,11 @@ Health check endpoints
 """
 from fastapi import APIRouter, HTTPException
 from datetime import datetime
+from typing import Dict, Optional
 import structlog
 
 from app.config import settings
+from app.core.cache import TTLCache
 from app.db.base import get_supabase_client
 from app.schemas.auth import HealthResponse
 from app.services.token_service import token_service
@@ -14,6 +16,11 @@ logger = structlog.get_logger()
 
 router = APIRouter(tags=["Health"])
 
+# Seconds a probe result is reused; load balancers poll /health every few
+# seconds and each probe costs two database round trips
+HEALTH_CACHE_TTL = 5
+_services_cache = TTLCache(maxsize=1, ttl=HEALTH_CACHE_TTL)
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check():
@@ -24,34 +31,10 @@ async def health_check():
     database connectivity and background service status.
     """
     try:
-        services = {}
-        
-        # Check database connection
-        try:
-            db = get_supabase_client()
-            # Simple query to verify connection
-            result = db.table("application_config").select("key").limit(1).execute()
-            services["database"] = "connected"
-        except Exception as e:
-            logger.warning("Database health check failed", error=str(e))
-            services["database"] = "disconnected"
-        
-        # Check token refresh service
-        try:
-            # Check if there's an active token
-            active_token = await token_service.get_active_token()
-            if active_token:
-                services["token_refresh"] = "running"
-                services["last_refresh"] = active_token.get(
-                    "last_refresh_at",
-                    active_token.get("created_at")
-                )
-            else:
-                services["token_refresh"] = "idle"
-                services["last_refresh"] = None
-        except Exception as e:
-            logger.warning("Token service health check failed", error=str(e))
-            services["token_refresh"] = "error"
+        services = _services_cache.get("services")
+        if services is None:
+            services = await _probe_services()
+            _services_cache.set("services", services)
         
         # Determine overall status
         overall_status = "healthy"
@@ -73,4 +56,43 @@ async def health_check():
                 "status": "unhealthy",
                 "error": str(e)
             }
-        )
\ No newline at end of file
+        )
+
+
+async def _probe_services() -> dict:
+    """
+    Check database connectivity and token refresh status
+    
+    Returns:
+        Service status dictionary
+    """
+    services: Dict[str, Optional[str]] = {}
+    
+    # Check database connection
+    try:
+        db = get_supabase_client()
+        # Simple query to verify connection
+        result = db.table("application_config").select("key").limit(1).execute()
+        services["database"] = "connected"
+    except Exception as e:
+        logger.warning("Database health check failed", error=str(e))
+        services["database"] = "disconnected"
+    
+    # Check token refresh service
+    try:
+        # Check if there's an active token
+        active_token = await token_service.get_active_token()
+        if active_token:
+            services["token_refresh"] = "running"
+            services["last_refresh"] = active_token.get(
+                "last_refresh_at",
+                active_token.get("created_at")
+            )
+        else:
+            services["token_refresh"] = "idle"
+            services["last_refresh"] = None
+    except Exception as e:
+        logger.warning("Token service health check failed", error=str(e))
+        services["token_refresh"] = "error"
+    
+    return services
\ No newline at end of file
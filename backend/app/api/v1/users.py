@@ -2,6 +2,7 @@
 User management endpoints with Clerk integration
 """
 from fastapi import APIRouter, HTTPException, status, Request, Depends
+from fastapi.responses import ORJSONResponse
 from typing import Dict, Any, List
 import structlog
 
@@ -49,17 +50,7 @@ async def get_current_user_profile(
                     detail="User not found"
                 )
         
-        return UserResponse(
-            id=user.id,
-            clerk_user_id=user.clerk_user_id,
-            email=user.email,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            profile_image_url=user.profile_image_url,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-            last_login_at=user.last_login_at
-        )
+        return UserResponse.from_row(user.to_dict())
         
     except HTTPException:
         raise
@@ -108,17 +99,7 @@ async def update_current_user_profile(
                 detail="Failed to update user"
             )
         
-        return UserResponse(
-            id=updated_user.id,
-            clerk_user_id=updated_user.clerk_user_id,
-            email=updated_user.email,
-            first_name=updated_user.first_name,
-            last_name=updated_user.last_name,
-            profile_image_url=updated_user.profile_image_url,
-            created_at=updated_user.created_at,
-            updated_at=updated_user.updated_at,
-            last_login_at=updated_user.last_login_at
-        )
+        return UserResponse.from_row(updated_user.to_dict())
         
     except HTTPException:
         raise
@@ -157,22 +138,10 @@ async def get_current_user_accounts(
         # Get user's Amazon accounts
         accounts = await account_service.get_user_accounts(user.id)
         
-        return [
-            AmazonAccountResponse(
-                id=account.id,
-                user_id=account.user_id,
-                account_name=account.account_name,
-                amazon_account_id=account.amazon_account_id,
-                marketplace_id=account.marketplace_id,
-                account_type=account.account_type,
-                is_default=account.is_default,
-                status=account.status,
-                connected_at=account.connected_at,
-                last_synced_at=account.last_synced_at,
-                metadata=account.metadata
-            )
-            for account in accounts
-        ]
+        # to_dict() already yields the AmazonAccountResponse fields as JSON
+        # types; encode directly rather than building and re-validating a
+        # model per row before serialization
+        return ORJSONResponse([account.to_dict() for account in accounts])
         
     except HTTPException:
         raise
@@ -216,33 +185,15 @@ async def get_current_user_with_accounts(
         # Get user's Amazon accounts
         accounts = await account_service.get_user_accounts(user.id)
         
-        return UserWithAccounts(
-            id=user.id,
-            clerk_user_id=user.clerk_user_id,
-            email=user.email,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            profile_image_url=user.profile_image_url,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-            last_login_at=user.last_login_at,
-            amazon_accounts=[
-                AmazonAccountResponse(
-                    id=account.id,
-                    user_id=account.user_id,
-                    account_name=account.account_name,
-                    amazon_account_id=account.amazon_account_id,
-                    marketplace_id=account.marketplace_id,
-                    account_type=account.account_type,
-                    is_default=account.is_default,
-                    status=account.status,
-                    connected_at=account.connected_at,
-                    last_synced_at=account.last_synced_at,
-                    metadata=account.metadata
-                )
+        # Rows come from our own tables: skip re-validating every nested
+        # account while building the response
+        return UserWithAccounts.from_row({
+            **user.to_dict(),
+            "amazon_accounts": [
+                AmazonAccountResponse.from_row(account.to_dict())
                 for account in accounts
             ]
-        )
+        })
         
     except HTTPException:
         raise
@@ -6,7 +6,7 @@ from typing import Dict, Any
 import json
 import structlog
 
-from app.services.clerk_service import ClerkWebhookHandler
+from app.services.clerk_service import ClerkWebhookHandler, SVIX_HEADERS
 from app.middleware.clerk_auth import verify_clerk_webhook
 
 logger = structlog.get_logger()
@@ -34,7 +34,7 @@ async def handle_clerk_webhook(request: Request):
     try:
         # Get raw body and headers
         body = await request.body()
-        headers = dict(request.headers)
+        headers = {name: request.headers[name] for name in SVIX_HEADERS if name in request.headers}
         
         logger.info("Received Clerk webhook", headers=headers)
         
@@ -181,7 +181,7 @@ async def validate_clerk_webhook_payload(request: Request):
     try:
         # Get raw body and headers
         body = await request.body()
-        headers = dict(request.headers)
+        headers = {name: request.headers[name] for name in SVIX_HEADERS if name in request.headers}
         
         # Verify webhook signature
         is_valid = webhook_handler.verify_webhook(body.decode(), headers)
@@ -59,6 +59,10 @@ class Settings(BaseSettings):
     token_refresh_buffer: int = 300  # seconds before expiry to trigger refresh
     max_refresh_retries: int = 5
     retry_backoff_base: int = 2
+
+    # Amazon Ads response caching (0 disables)
+    amazon_profiles_cache_ttl: int = 300  # seconds, list_profiles / get_profile
+    amazon_accounts_cache_ttl: int = 30  # seconds, list_ads_accounts
     
     # API Version
     api_version: str = "1.0.1"
@@ -3,6 +3,8 @@ Custom exception classes
 """
 from typing import Optional, Dict, Any
 
+from fastapi import HTTPException
+
 
 class OAuthException(Exception):
     """Base exception for OAuth errors"""
@@ -141,6 +143,17 @@ class AmazonAuthError(OAuthException):
         )
 
 
+class AuthenticationRequiredError(HTTPException):
+    """Raised when an endpoint requires an authenticated Clerk user"""
+
+    def __init__(self):
+        super().__init__(
+            status_code=401,
+            detail="Authentication required",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+
 class DSPSeatsError(Exception):
     """Base exception for DSP Seats API errors"""
     pass
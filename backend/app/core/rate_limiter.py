@@ -23,13 +23,18 @@ class RateLimitError(Exception):
         super().__init__(f"Rate limit exceeded. Retry after {retry_after} seconds")
 
 
+class TransientAPIError(Exception):
+    """Exception raised for retryable upstream failures (5xx, timeouts, network errors)"""
+
+
 class ExponentialBackoffRateLimiter:
     """
     Rate limiter with exponential backoff for Amazon API calls
 
     Features:
     - Exponential backoff with jitter
-    - Respects Retry-After headers
+    - Waits exactly the Retry-After delay when the server provides one
+    - Retries transient 5xx / network failures
     - Circuit breaker pattern
     - Request rate limiting
     """
@@ -37,6 +42,7 @@ class ExponentialBackoffRateLimiter:
     def __init__(
         self,
         max_retries: int = 5,
+        max_transient_retries: int = 3,
         base_delay: float = 1.0,
         max_delay: float = 60.0,
         rate_limit: int = 2,  # requests per second
@@ -44,6 +50,7 @@ class ExponentialBackoffRateLimiter:
         user_id: Optional[str] = None
     ):
         self.max_retries = max_retries
+        self.max_transient_retries = min(max_transient_retries, max_retries)
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.rate_limit = rate_limit
@@ -60,6 +67,7 @@ class ExponentialBackoffRateLimiter:
         func: Callable,
         *args,
         endpoint: Optional[str] = None,
+        isolated: bool = False,
         **kwargs
     ) -> Any:
         """
@@ -68,6 +76,9 @@ class ExponentialBackoffRateLimiter:
         Args:
             func: Async function to execute
             *args: Function arguments
+            isolated: Only retry; skip the shared request throttle and circuit
+                breaker, so per-user calls on a singleton limiter cannot slow
+                down or lock out other users
             **kwargs: Function keyword arguments
 
         Returns:
@@ -77,7 +88,7 @@ class ExponentialBackoffRateLimiter:
             Exception: After max retries exceeded
         """
         # Check circuit breaker
-        if self.circuit_open:
+        if self.circuit_open and not isolated:
             if time.time() < self.circuit_open_until:
                 wait_time = self.circuit_open_until - time.time()
                 logger.warning(
@@ -95,16 +106,18 @@ class ExponentialBackoffRateLimiter:
         for attempt in range(self.max_retries):
             try:
                 # Check rate limit
-                await self._check_rate_limit()
+                if not isolated:
+                    await self._check_rate_limit()
 
                 # Execute function
                 result = await func(*args, **kwargs)
 
-                # Reset consecutive failures on success
-                self.consecutive_failures = 0
+                if not isolated:
+                    # Reset consecutive failures on success
+                    self.consecutive_failures = 0
 
-                # Record successful request
-                self.request_times.append(time.time())
+                    # Record successful request
+                    self.request_times.append(time.time())
 
                 # Track successful request in database
                 if endpoint:
@@ -113,7 +126,8 @@ class ExponentialBackoffRateLimiter:
                 return result
 
             except RateLimitError as e:
-                self.consecutive_failures += 1
+                if not isolated:
+                    self.consecutive_failures += 1
 
                 # Track rate limit hit in database
                 if endpoint:
@@ -121,18 +135,11 @@ class ExponentialBackoffRateLimiter:
 
                 if attempt == self.max_retries - 1:
                     # Open circuit breaker after max retries
-                    self._open_circuit_breaker()
+                    if not isolated:
+                        self._open_circuit_breaker()
                     raise
 
-                # Calculate backoff delay with jitter
-                delay = min(
-                    self.base_delay * (2 ** attempt) + random.uniform(0, 1),
-                    self.max_delay
-                )
-
-                # Use Retry-After header if available
-                if e.retry_after:
-                    delay = max(delay, e.retry_after)
+                delay = self._retry_delay(attempt, e.retry_after)
 
                 logger.warning(
                     "Rate limited, retrying with backoff",
@@ -144,6 +151,22 @@ class ExponentialBackoffRateLimiter:
 
                 await asyncio.sleep(delay)
 
+            except TransientAPIError as e:
+                if attempt >= self.max_transient_retries - 1:
+                    raise
+
+                delay = self._retry_delay(attempt)
+
+                logger.warning(
+                    "Transient API error, retrying with backoff",
+                    attempt=attempt + 1,
+                    max_retries=self.max_transient_retries,
+                    delay_seconds=delay,
+                    error=str(e)
+                )
+
+                await asyncio.sleep(delay)
+
             except Exception as e:
                 # For non-rate-limit errors, check if it's a 429 status
                 if hasattr(e, 'status_code') and e.status_code == 429:
@@ -158,12 +181,7 @@ class ExponentialBackoffRateLimiter:
                     rate_error = RateLimitError(retry_after)
 
                     if attempt < self.max_retries - 1:
-                        delay = min(
-                            self.base_delay * (2 ** attempt) + random.uniform(0, 1),
-                            self.max_delay
-                        )
-                        if retry_after:
-                            delay = max(delay, retry_after)
+                        delay = self._retry_delay(attempt, retry_after)
 
                         logger.warning(
                             "HTTP 429 detected, retrying",
@@ -173,12 +191,32 @@ class ExponentialBackoffRateLimiter:
                         await asyncio.sleep(delay)
                         continue
                     else:
-                        self._open_circuit_breaker()
+                        if not isolated:
+                            self._open_circuit_breaker()
                         raise rate_error
                 else:
                     # Re-raise non-rate-limit errors
                     raise
 
+    def _retry_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Delay before the next attempt
+
+        Args:
+            attempt: Zero-based attempt that just failed
+            retry_after: Server-provided Retry-After seconds, if any
+
+        Returns:
+            Retry-After plus a little jitter when the server said how long to
+            wait, otherwise exponential backoff with jitter capped at max_delay
+        """
+        if retry_after:
+            return retry_after + random.uniform(0, 0.5)
+        return min(
+            self.base_delay * (2 ** attempt) + random.uniform(0, 1),
+            self.max_delay
+        )
+
     async def _check_rate_limit(self):
         """Check and enforce rate limit"""
         now = time.time()
@@ -2,7 +2,7 @@
 Supabase database connection
 """
 from supabase import create_client, Client
-from typing import Optional
+from functools import lru_cache
 import structlog
 
 from app.config import settings
@@ -10,60 +10,45 @@ from app.config import settings
 logger = structlog.get_logger()
 
 
-class SupabaseClient:
-    """Manage Supabase connection"""
+@lru_cache(maxsize=2)
+def _client(use_service_role: bool) -> Client:
+    """
+    Create the Supabase client for the given key type once per process
+
+    Args:
+        use_service_role: If True, use service role key for admin operations
 
-    _instance: Optional[Client] = None
-    _service_instance: Optional[Client] = None
+    Returns:
+        Supabase client
+    """
+    if use_service_role:
+        # Use service role key for backend operations that need to bypass RLS
+        try:
+            # Use service role key if available, otherwise fall back to anon key
+            key = settings.supabase_service_role_key or settings.supabase_key
+            client = create_client(settings.supabase_url, key)
+            logger.info(
+                "Supabase service client initialized",
+                using_service_role=bool(settings.supabase_service_role_key)
+            )
+            return client
+        except Exception as e:
+            logger.error("Failed to initialize Supabase service client", error=str(e))
+            raise
 
-    @classmethod
-    def get_client(cls, use_service_role: bool = False) -> Client:
-        """
-        Get or create Supabase client instance
+    # Use anon key for regular operations
+    try:
+        client = create_client(settings.supabase_url, settings.supabase_key)
+        logger.info("Supabase client initialized")
+        return client
+    except Exception as e:
+        logger.error("Failed to initialize Supabase client", error=str(e))
+        raise
 
-        Args:
-            use_service_role: If True, use service role key for admin operations
 
-        Returns:
-            Supabase client
-        """
-        if use_service_role:
-            # Use service role key for backend operations that need to bypass RLS
-            if cls._service_instance is None:
-                try:
-                    # Use service role key if available, otherwise fall back to anon key
-                    key = settings.supabase_service_role_key or settings.supabase_key
-                    cls._service_instance = create_client(
-                        settings.supabase_url,
-                        key
-                    )
-                    logger.info(
-                        "Supabase service client initialized",
-                        using_service_role=bool(settings.supabase_service_role_key)
-                    )
-                except Exception as e:
-                    logger.error("Failed to initialize Supabase service client", error=str(e))
-                    raise
-            return cls._service_instance
-        else:
-            # Use anon key for regular operations
-            if cls._instance is None:
-                try:
-                    cls._instance = create_client(
-                        settings.supabase_url,
-                        settings.supabase_key
-                    )
-                    logger.info("Supabase client initialized")
-                except Exception as e:
-                    logger.error("Failed to initialize Supabase client", error=str(e))
-                    raise
-            return cls._instance
-    
-    @classmethod
-    def reset_client(cls):
-        """Reset the client instances (useful for testing)"""
-        cls._instance = None
-        cls._service_instance = None
+def reset_client():
+    """Reset the client instances (useful for testing)"""
+    _client.cache_clear()
 
 
 def get_supabase_client() -> Client:
@@ -73,7 +58,7 @@ def get_supabase_client() -> Client:
     Returns:
         Supabase client instance
     """
-    return SupabaseClient.get_client(use_service_role=False)
+    return _client(False)
 
 
 def get_supabase_service_client() -> Client:
@@ -83,4 +68,4 @@ def get_supabase_service_client() -> Client:
     Returns:
         Supabase client instance with service role
     """
-    return SupabaseClient.get_client(use_service_role=True)
\ No newline at end of file
+    return _client(True)
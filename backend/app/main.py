@@ -5,8 +5,10 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Literal
 import asyncio
 import structlog
 from pathlib import Path
@@ -22,6 +24,10 @@ from app.middleware.error_handler import (
     general_exception_handler
 )
 from app.core.exceptions import OAuthException
+from app.db.base import get_supabase_client, get_supabase_service_client
+from app.middleware.clerk_auth import clerk_middleware
+from app.services.account_service import account_service
+from app.services.dsp_amc_service import dsp_amc_service
 from app.services.refresh_service import start_refresh_service, stop_refresh_service
 from app.services.token_refresh_scheduler import get_token_refresh_scheduler
 
@@ -48,6 +54,21 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to start token refresh scheduler: {e}")
 
+    # Create both cached Supabase clients now (~45ms each), so the first
+    # request that needs one doesn't pay for client construction
+    try:
+        get_supabase_client()
+        get_supabase_service_client()
+    except Exception as e:
+        logger.warning("Failed to pre-create Supabase clients", error=str(e))
+
+    # Build (and cache) the OpenAPI schema now, so JSON schema generation for
+    # every response model is paid once at startup, not by the first request
+    try:
+        app.openapi()
+    except Exception as e:
+        logger.warning("Failed to pre-build OpenAPI schema", error=str(e))
+
     yield
 
     # Shutdown
@@ -64,6 +85,11 @@ async def lifespan(app: FastAPI):
     # Stop background services
     await stop_refresh_service(refresh_task)
 
+    # Close pooled HTTP clients
+    await clerk_middleware.clerk_service.close()
+    await account_service.close()
+    await dsp_amc_service.close()
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -71,6 +97,7 @@ app = FastAPI(
     description="OAuth 2.0 authentication service for Amazon Advertising",
     version=settings.api_version,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.environment == "development" else None,
     redoc_url="/redoc" if settings.environment == "development" else None,
 )
@@ -162,7 +189,29 @@ frontend_dist = Path(__file__).parent.parent.parent / "frontend" / "dist"
 if frontend_dist.exists():
     # Mount static files for assets
     app.mount("/assets", StaticFiles(directory=str(frontend_dist / "assets")), name="assets")
-    
+
+    frontend_index = str(frontend_dist / "index.html")
+
+    # Paths probed by scanners/bots that are never part of the SPA
+    REJECTED_SUFFIXES = (".php", ".env", ".asp", ".aspx", ".jsp", ".cgi", ".git", ".sql", ".bak")
+    REJECTED_PREFIXES = (".env", ".git", "wp-", "cgi-bin/")
+
+    @lru_cache(maxsize=4096)
+    def _classify_frontend_path(full_path: str) -> Literal["file", "index", "reject"]:
+        """
+        Classify a frontend path once so repeated requests skip the disk probes
+
+        Returns:
+            "file" for a static file in the build, "reject" for obvious
+            non-SPA probes, otherwise "index" for client-side routing
+        """
+        lowered = full_path.lower()
+        if lowered.endswith(REJECTED_SUFFIXES) or lowered.startswith(REJECTED_PREFIXES):
+            return "reject"
+        if (frontend_dist / full_path).is_file():
+            return "file"
+        return "index"
+
     # Serve index.html for all non-API routes (MUST be last)
     @app.get("/{full_path:path}")
     async def serve_frontend(full_path: str):
@@ -172,21 +221,22 @@ if frontend_dist.exists():
         # Skip API routes - this shouldn't be reached due to route ordering
         if full_path.startswith("api/"):
             raise HTTPException(status_code=404, detail="API endpoint not found")
-        
-        # Check if requesting a static file
-        file_path = frontend_dist / full_path
-        if file_path.exists() and file_path.is_file():
-            return FileResponse(str(file_path))
-        
+
+        kind = _classify_frontend_path(full_path)
+        if kind == "file":
+            return FileResponse(str(frontend_dist / full_path))
+        if kind == "reject":
+            raise HTTPException(status_code=404, detail="Not found")
+
         # Otherwise serve index.html for client-side routing
-        return FileResponse(str(frontend_dist / "index.html"))
-    
+        return FileResponse(frontend_index)
+
     @app.get("/")
     async def root():
         """
         Serve frontend index
         """
-        return FileResponse(str(frontend_dist / "index.html"))
+        return FileResponse(frontend_index)
 else:
     @app.get("/")
     async def root():
@@ -5,30 +5,60 @@ from fastapi import Request, HTTPException, Depends
 from fastapi import status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional, Dict, Any, Callable
+import asyncio
+import hashlib
+import logging
+import time
+import jwt
 import structlog
 
-from app.services.clerk_service import ClerkService
+from app.core.cache import TTLCache
+from app.core.exceptions import AuthenticationRequiredError
+from app.services.clerk_service import ClerkService, SVIX_HEADERS
 from app.services.user_service import UserService
 from app.schemas.user import UserCreate
 
 logger = structlog.get_logger()
+_stdlib_logger = logging.getLogger(__name__)
 security = HTTPBearer(auto_error=False)
 
+BEARER_PREFIX = "Bearer "
+
+# Shared service instances, so the JWKS cache and HTTP client live once per process
+_clerk_service = ClerkService()
+
+# Verified session claims keyed by token digest, shared across requests
+SESSION_CACHE_TTL = 300  # seconds
+_session_cache = TTLCache(maxsize=10000, ttl=SESSION_CACHE_TTL)
+
+
+# Database user rows keyed by Clerk user ID, and users whose last login was
+# recently written, so authenticated requests skip the Supabase round-trips
+USER_CACHE_TTL = 60  # seconds
+LAST_LOGIN_DEBOUNCE = 300  # seconds
+_user_cache = TTLCache(maxsize=10000, ttl=USER_CACHE_TTL)
+_last_login_written = TTLCache(maxsize=10000, ttl=LAST_LOGIN_DEBOUNCE)
+
+# Strong references to fire-and-forget tasks so they are not collected early
+_background_tasks = set()
+
+
+def _session_cache_key(token: str) -> str:
+    """Short digest of the session token so raw JWTs are never used as keys"""
+    return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
 
 class ClerkAuthMiddleware:
     """Middleware for Clerk authentication"""
     
     def __init__(self):
         """Initialize middleware"""
-        self.clerk_service = ClerkService()
-        self._user_service = None
+        self.clerk_service = _clerk_service
 
     @property
-    def user_service(self):
-        """Lazy initialization of user service"""
-        if self._user_service is None:
-            self._user_service = UserService()
-        return self._user_service
+    def user_service(self) -> UserService:
+        """User service shared with the Clerk service"""
+        return self.clerk_service.user_service
     
     async def authenticate_request(self, request: Request) -> Optional[Dict[str, Any]]:
         """
@@ -45,29 +75,54 @@ class ClerkAuthMiddleware:
             auth_header = request.headers.get("Authorization")
             token = None
 
-            logger.debug(f"Auth header present: {bool(auth_header)}")
+            logger.debug("Auth header present", present=bool(auth_header))
 
             if auth_header:
                 token = self.extract_token_from_header(auth_header)
-                logger.debug(f"Token extracted from header: {bool(token)}")
+                logger.debug("Token extracted from header", found=bool(token))
 
-            # If no token in header, try session cookie
-            if not token:
+            # If no token in header, try session cookie (only parse cookies
+            # when a Cookie header was actually sent)
+            if not token and "cookie" in request.headers:
                 token = request.cookies.get("__session")
-                logger.debug(f"Token from cookie: {bool(token)}")
+                logger.debug("Token from cookie", found=bool(token))
 
             if not token:
                 logger.debug("No token found in request")
                 return None
 
             # Log token prefix for debugging (first 20 chars)
-            logger.debug(f"Token prefix: {token[:20]}..." if len(token) > 20 else f"Token: {token}")
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Token received", prefix=token[:20])
+
+            # Reuse a previous verification while the token is still valid
+            cache_key = _session_cache_key(token)
+            clerk_data = _session_cache.get(cache_key)
+
+            if clerk_data is None:
+                # Verify token with Clerk, prefetching the user row meanwhile.
+                # The unverified subject is only used to warm the read cache;
+                # nothing is trusted or written until verification succeeds.
+                unverified_sub = self._unverified_subject(token)
+                if unverified_sub:
+                    clerk_data, _ = await asyncio.gather(
+                        self.clerk_service.verify_session_token(token),
+                        self._lookup_user(unverified_sub)
+                    )
+                else:
+                    clerk_data = await self.clerk_service.verify_session_token(token)
 
-            # Verify token with Clerk
-            clerk_data = await self.clerk_service.verify_session_token(token)
+                # Never cache past the token's own expiry
+                exp = clerk_data.get("exp") if clerk_data else None
+                if exp:
+                    _session_cache.set(
+                        cache_key,
+                        clerk_data,
+                        ttl=min(SESSION_CACHE_TTL, exp - time.time())
+                    )
 
             if clerk_data:
-                logger.info(f"User authenticated: {clerk_data.get('sub')}")
+                logger.info("User authenticated", clerk_user_id=clerk_data.get("sub"))
 
                 # Ensure user exists in our database
                 user_data = await self.ensure_user_exists(clerk_data)
@@ -82,7 +137,7 @@ class ClerkAuthMiddleware:
                     }
                 else:
                     # If we couldn't create/find user, log error but still return Clerk data
-                    logger.error(f"Failed to sync user to database: {clerk_data.get('sub')}")
+                    logger.error("Failed to sync user to database", clerk_user_id=clerk_data.get("sub"))
                     # Return Clerk data without database user ID
                     return {
                         **clerk_data,
@@ -115,53 +170,110 @@ class ClerkAuthMiddleware:
                 return None
 
             # Try to get existing user
-            user = await self.user_service.get_user_by_clerk_id(clerk_user_id)
+            user_dict = await self._lookup_user(clerk_user_id)
 
-            if user:
+            if user_dict:
                 # Update last login
-                await self.user_service.update_last_login(clerk_user_id)
-                return user.to_dict()
+                self._record_login(clerk_user_id)
+                return user_dict
 
             # User doesn't exist, create them
             logger.info(f"Creating new user for Clerk ID: {clerk_user_id}")
 
             # Get user details from Clerk if needed
             # For now, use data from the token
+            email = clerk_data.get("email")
+            if not email:
+                email = clerk_user_id + "@clerk.user"
+
             user_create = UserCreate(
                 clerk_user_id=clerk_user_id,
-                email=clerk_data.get("email") or f"{clerk_user_id}@clerk.user",
+                email=email,
                 first_name=clerk_data.get("first_name") or "",
                 last_name=clerk_data.get("last_name") or "",
                 profile_image_url=clerk_data.get("image_url")
             )
 
             new_user = await self.user_service.create_user(user_create)
-            return new_user.to_dict() if new_user else None
+            if not new_user:
+                return None
+
+            user_dict = new_user.to_dict()
+            _user_cache.set(clerk_user_id, user_dict)
+            return user_dict
 
         except Exception as e:
             logger.error(f"Error ensuring user exists: {str(e)}", exc_info=True)
             return None
 
-    def extract_token_from_header(self, auth_header: str) -> Optional[str]:
+    async def _lookup_user(self, clerk_user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a user row by Clerk ID, served from the short-lived user cache
+
+        Args:
+            clerk_user_id: Clerk user ID
+
+        Returns:
+            User data from database or None
+        """
+        cached_user = _user_cache.get(clerk_user_id)
+        if cached_user is not None:
+            return cached_user
+
+        user = await self.user_service.get_user_by_clerk_id(clerk_user_id)
+        if not user:
+            return None
+
+        user_dict = user.to_dict()
+        _user_cache.set(clerk_user_id, user_dict)
+        return user_dict
+
+    @staticmethod
+    def _unverified_subject(token: str) -> Optional[str]:
+        """
+        Read the sub claim without verifying the signature
+
+        Args:
+            token: JWT session token
+
+        Returns:
+            Subject claim, or None if the token cannot be decoded
+        """
+        try:
+            return jwt.decode(token, options={"verify_signature": False}).get("sub")
+        except jwt.InvalidTokenError:
+            return None
+
+    def _record_login(self, clerk_user_id: str) -> None:
+        """
+        Update last login in the background, at most once per debounce window
+
+        Args:
+            clerk_user_id: Clerk user ID
+        """
+        if clerk_user_id in _last_login_written:
+            return
+        _last_login_written.set(clerk_user_id, True)
+
+        task = asyncio.create_task(self.user_service.update_last_login(clerk_user_id))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+    @staticmethod
+    def extract_token_from_header(auth_header: str) -> Optional[str]:
         """
         Extract token from Authorization header
-        
+
+        Handles both "Bearer <token>" and a bare token.
+
         Args:
             auth_header: Authorization header value
-            
+
         Returns:
             Token if found, None otherwise
         """
-        if not auth_header:
-            return None
-        
-        # Handle "Bearer token" format
-        if auth_header.startswith("Bearer "):
-            return auth_header[7:]
-        
-        # Handle just the token
-        return auth_header if auth_header else None
-    
+        return auth_header.removeprefix(BEARER_PREFIX) if auth_header else None
+
     async def get_current_user(self, request: Request) -> Optional[Dict[str, Any]]:
         """
         Get current authenticated user
@@ -208,11 +320,7 @@ async def get_current_user_required(request: Request) -> Dict[str, Any]:
     user = await clerk_middleware.get_current_user(request)
     
     if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authentication required",
-            headers={"WWW-Authenticate": "Bearer"}
-        )
+        raise AuthenticationRequiredError()
     
     return user
 
@@ -266,11 +374,7 @@ class ClerkUserDependency:
         user = await clerk_middleware.get_current_user(request)
         
         if self.required and not user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Authentication required",
-                headers={"WWW-Authenticate": "Bearer"}
-            )
+            raise AuthenticationRequiredError()
         
         return user
 
@@ -293,10 +397,17 @@ async def verify_clerk_webhook(request: Request) -> bool:
     Raises:
         HTTPException: If signature verification fails
     """
+    # Reject unsigned deliveries before reading or decoding the body
+    headers = {name: request.headers[name] for name in SVIX_HEADERS if name in request.headers}
+    if len(headers) != len(SVIX_HEADERS):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Missing webhook signature headers"
+        )
+
     try:
         # Get raw body
         body = await request.body()
-        headers = dict(request.headers)
         
         # Initialize webhook handler
         from app.services.clerk_service import ClerkWebhookHandler
@@ -319,6 +430,20 @@ async def verify_clerk_webhook(request: Request) -> bool:
         )
 
 
+# (context key, Clerk claim) pairs copied by get_user_context
+USER_CONTEXT_KEYS = (
+    ("clerk_user_id", "sub"),
+    ("email", "email"),
+    ("first_name", "given_name"),
+    ("last_name", "family_name"),
+    ("full_name", "name"),
+    ("profile_image", "picture"),
+    ("auth_time", "auth_time"),
+    ("session_id", "sid"),
+    ("db_user", "db_user"),  # Include full database user data
+)
+
+
 def get_user_context(user_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Extract useful context from user data for application use
@@ -338,17 +463,8 @@ def get_user_context(user_data: Dict[str, Any]) -> Dict[str, Any]:
         # Extract from db_user object
         db_user_id = user_data["db_user"].get("id")
 
-    return {
-        "user_id": db_user_id,  # This should be the database UUID
-        "clerk_user_id": user_data.get("sub"),
-        "email": user_data.get("email"),
-        "email_verified": user_data.get("email_verified", False),
-        "first_name": user_data.get("given_name"),
-        "last_name": user_data.get("family_name"),
-        "full_name": user_data.get("name"),
-        "profile_image": user_data.get("picture"),
-        "is_authenticated": True,
-        "auth_time": user_data.get("auth_time"),
-        "session_id": user_data.get("sid"),
-        "db_user": user_data.get("db_user")  # Include full database user data
-    }
\ No newline at end of file
+    context = {out_key: user_data.get(in_key) for out_key, in_key in USER_CONTEXT_KEYS}
+    context["user_id"] = db_user_id  # This should be the database UUID
+    context["email_verified"] = user_data.get("email_verified", False)
+    context["is_authenticated"] = True
+    return context
\ No newline at end of file
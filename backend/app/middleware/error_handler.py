@@ -2,17 +2,31 @@
 Global error handling middleware
 """
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 import structlog
-import traceback
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+from typing import Optional
 
-from app.core.exceptions import OAuthException
+from app.core.exceptions import OAuthException, AuthenticationRequiredError
 
 logger = structlog.get_logger()
 
+# Pre-encoded body for AuthenticationRequiredError; only the timestamp varies
+_AUTH_REQUIRED_BODY_PREFIX = (
+    b'{"error":{"code":"HTTP_401","message":"Authentication required",'
+    b'"details":{},"timestamp":"'
+)
+
+
+def _utc_timestamp(t: Optional[float] = None) -> str:
+    """Format an epoch time (default: now) as an ISO-8601 UTC string"""
+    if t is None:
+        t = time.time()
+    return datetime.fromtimestamp(t, tz=timezone.utc).isoformat(timespec="milliseconds")
+
 
 async def oauth_exception_handler(request: Request, exc: OAuthException):
     """
@@ -33,7 +47,7 @@ async def oauth_exception_handler(request: Request, exc: OAuthException):
                 "code": exc.code,
                 "message": exc.message,
                 "details": exc.details,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": _utc_timestamp()
             }
         }
     )
@@ -50,6 +64,15 @@ async def http_exception_handler(request: Request, exc: HTTPException):
         path=request.url.path
     )
     
+    # Unauthenticated clients can repeat this one a lot, skip JSON encoding
+    if isinstance(exc, AuthenticationRequiredError):
+        return Response(
+            content=_AUTH_REQUIRED_BODY_PREFIX + _utc_timestamp().encode() + b'"}}',
+            status_code=exc.status_code,
+            headers=exc.headers,
+            media_type="application/json"
+        )
+
     # If detail is already structured, use it as-is
     if isinstance(exc.detail, dict) and "error" in exc.detail:
         return JSONResponse(
@@ -65,7 +88,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
                 "code": f"HTTP_{exc.status_code}",
                 "message": str(exc.detail),
                 "details": {},
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": _utc_timestamp()
             }
         }
     )
@@ -90,7 +113,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
                 "details": {
                     "errors": exc.errors()
                 },
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": _utc_timestamp()
             }
         }
     )
@@ -100,13 +123,13 @@ async def general_exception_handler(request: Request, exc: Exception):
     """
     Handle uncaught exceptions
     """
-    error_id = datetime.utcnow().timestamp()
+    error_id = time.time()
     
     logger.error(
         "Unhandled exception",
         error_id=error_id,
         error=str(exc),
-        traceback=traceback.format_exc(),
+        exc_info=exc,
         path=request.url.path
     )
     
@@ -127,7 +150,7 @@ async def general_exception_handler(request: Request, exc: Exception):
                     "error_id": error_id,
                     "type": error_type
                 },
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": _utc_timestamp(error_id)
             }
         }
     )
\ No newline at end of file
@@ -2,10 +2,56 @@
 Amazon Account model for managing connected Amazon Advertising accounts
 """
 from datetime import datetime, timezone
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Optional, Dict, Any
 from uuid import uuid4
 
 
+# Timestamp columns parsed from ISO strings in from_dict
+DATETIME_FIELDS = ("connected_at", "last_synced_at")
+
+# Full user_accounts row columns, in AmazonAccount.__init__ positional order
+ROW_COLUMNS = (
+    "user_id",
+    "account_name",
+    "amazon_account_id",
+    "marketplace_id",
+    "account_type",
+    "is_default",
+    "status",
+    "metadata",
+    "id",
+    "connected_at",
+    "last_synced_at",
+)
+_row_values = itemgetter(*ROW_COLUMNS)
+
+# Human-readable names for Amazon marketplace IDs
+MARKETPLACE_NAMES = MappingProxyType({
+    "ATVPDKIKX0DER": "United States",
+    "A2EUQ1WTGCTBG2": "Canada",
+    "A1AM78C64UM0Y8": "Mexico",
+    "A2Q3Y263D00KWC": "Brazil",
+    "A1RKKUPIHCS9HS": "Spain",
+    "A1F83G8C2ARO7P": "United Kingdom",
+    "A13V1IB3VIYZZH": "France",
+    "APJ6JRA9NG5V4": "Italy",
+    "A1PA6795UKMFR9": "Germany",
+    "A1805IZSGTT6HS": "Netherlands",
+    "A2NODRKZP88ZB9": "Sweden",
+    "A1C3SOZRARQ6R3": "Poland",
+    "ARBP9OOSHTCHU": "Egypt",
+    "A33AVAJ2PDY3EV": "Turkey",
+    "A39IBJ37TRP1C6": "Australia",
+    "A21TJRUUN4KGV": "India",
+    "A19VAU5U5O7RUS": "Singapore",
+    "A2VIGQ35RCS4UG": "United Arab Emirates",
+    "AAHKV2X7AFYLW": "China",
+    "A1VC38T7YXB528": "Japan"
+})
+
+
 class AmazonAccount:
     """
     Model representing a connected Amazon Advertising account
@@ -15,6 +61,21 @@ class AmazonAccount:
     """
     
     TABLE_NAME = "user_accounts"
+
+    # Fixed attribute set: no per-instance __dict__ for large account lists
+    __slots__ = (
+        "id",
+        "user_id",
+        "account_name",
+        "amazon_account_id",
+        "marketplace_id",
+        "account_type",
+        "is_default",
+        "status",
+        "metadata",
+        "connected_at",
+        "last_synced_at",
+    )
     
     def __init__(
         self,
@@ -66,29 +127,7 @@ class AmazonAccount:
     @property
     def marketplace_name(self) -> str:
         """Get human-readable marketplace name"""
-        marketplace_map = {
-            "ATVPDKIKX0DER": "United States",
-            "A2EUQ1WTGCTBG2": "Canada",
-            "A1AM78C64UM0Y8": "Mexico",
-            "A2Q3Y263D00KWC": "Brazil",
-            "A1RKKUPIHCS9HS": "Spain",
-            "A1F83G8C2ARO7P": "United Kingdom",
-            "A13V1IB3VIYZZH": "France",
-            "APJ6JRA9NG5V4": "Italy",
-            "A1PA6795UKMFR9": "Germany",
-            "A1805IZSGTT6HS": "Netherlands",
-            "A2NODRKZP88ZB9": "Sweden",
-            "A1C3SOZRARQ6R3": "Poland",
-            "ARBP9OOSHTCHU": "Egypt",
-            "A33AVAJ2PDY3EV": "Turkey",
-            "A39IBJ37TRP1C6": "Australia",
-            "A21TJRUUN4KGV": "India",
-            "A19VAU5U5O7RUS": "Singapore",
-            "A2VIGQ35RCS4UG": "United Arab Emirates",
-            "AAHKV2X7AFYLW": "China",
-            "A1VC38T7YXB528": "Japan"
-        }
-        return marketplace_map.get(self.marketplace_id, "Unknown")
+        return MARKETPLACE_NAMES.get(self.marketplace_id, "Unknown")
     
     def to_dict(self) -> dict:
         """Convert model to dictionary for database operations"""
@@ -109,10 +148,29 @@ class AmazonAccount:
     @classmethod
     def from_dict(cls, data: dict) -> "AmazonAccount":
         """Create AmazonAccount instance from dictionary"""
+        # Fast path for complete rows (e.g. select("*")): one C-level lookup
+        # of every column instead of a .get() call per field
+        try:
+            values = _row_values(data)
+        except KeyError:
+            return cls._from_partial_dict(data)
+
+        *head, connected_at, last_synced_at = values
+        if connected_at and isinstance(connected_at, str):
+            connected_at = datetime.fromisoformat(connected_at)
+        if last_synced_at and isinstance(last_synced_at, str):
+            last_synced_at = datetime.fromisoformat(last_synced_at)
+
+        return cls(*head, connected_at, last_synced_at)
+
+    @classmethod
+    def _from_partial_dict(cls, data: dict) -> "AmazonAccount":
+        """Create AmazonAccount instance from a dictionary missing some columns"""
         # Handle datetime conversion
-        for field in ["connected_at", "last_synced_at"]:
+        # (fromisoformat accepts the trailing "Z" natively on Python 3.11+)
+        for field in DATETIME_FIELDS:
             if data.get(field) and isinstance(data[field], str):
-                data[field] = datetime.fromisoformat(data[field].replace('Z', '+00:00'))
+                data[field] = datetime.fromisoformat(data[field])
         
         return cls(
             id=data.get("id"),
@@ -6,6 +6,14 @@ from typing import Optional, List
 from uuid import uuid4
 
 
+# Timestamp columns parsed from ISO strings in from_dict
+DATETIME_FIELDS = ("created_at", "updated_at", "last_login_at")
+
+# Bound once so per-row construction skips the global + attribute lookups
+_utcnow = datetime.utcnow
+_fromisoformat = datetime.fromisoformat
+
+
 class User:
     """
     User model representing authenticated users via Clerk
@@ -15,6 +23,20 @@ class User:
     """
     
     TABLE_NAME = "users"
+
+    # Fixed attribute set: no per-instance __dict__ for large user batches
+    __slots__ = (
+        "id",
+        "clerk_user_id",
+        "email",
+        "first_name",
+        "last_name",
+        "profile_image_url",
+        "created_at",
+        "updated_at",
+        "last_login_at",
+        "_amazon_accounts",
+    )
     
     def __init__(
         self,
@@ -48,8 +70,8 @@ class User:
         self.first_name = first_name
         self.last_name = last_name
         self.profile_image_url = profile_image_url
-        self.created_at = created_at or datetime.utcnow()
-        self.updated_at = updated_at or datetime.utcnow()
+        self.created_at = created_at or _utcnow()
+        self.updated_at = updated_at or _utcnow()
         self.last_login_at = last_login_at
         self._amazon_accounts: List = []
     
@@ -63,7 +85,7 @@ class User:
         elif self.last_name:
             return self.last_name
         else:
-            return self.email.split('@')[0]
+            return self.email.partition('@')[0]
     
     @property
     def amazon_accounts(self) -> List:
@@ -77,6 +99,11 @@ class User:
     
     def to_dict(self) -> dict:
         """Convert model to dictionary for database operations"""
+        # A dict literal builds faster than looping over field-name tuples;
+        # timestamps are read once each into locals
+        created_at = self.created_at
+        updated_at = self.updated_at
+        last_login_at = self.last_login_at
         return {
             "id": self.id,
             "clerk_user_id": self.clerk_user_id,
@@ -84,18 +111,21 @@ class User:
             "first_name": self.first_name,
             "last_name": self.last_name,
             "profile_image_url": self.profile_image_url,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "last_login_at": self.last_login_at.isoformat() if self.last_login_at else None
+            "created_at": created_at.isoformat() if created_at else None,
+            "updated_at": updated_at.isoformat() if updated_at else None,
+            "last_login_at": last_login_at.isoformat() if last_login_at else None
         }
     
     @classmethod
     def from_dict(cls, data: dict) -> "User":
         """Create User instance from dictionary"""
         # Handle datetime conversion
-        for field in ["created_at", "updated_at", "last_login_at"]:
-            if data.get(field) and isinstance(data[field], str):
-                data[field] = datetime.fromisoformat(data[field].replace('Z', '+00:00'))
+        # (fromisoformat accepts the trailing "Z" natively on Python 3.11+)
+        for field in DATETIME_FIELDS:
+            value = data.get(field)
+            # Exact type check: Supabase rows hold plain str, never subclasses
+            if value and type(value) is str:
+                data[field] = _fromisoformat(value)
         
         return cls(
             id=data.get("id"),
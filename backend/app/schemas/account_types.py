@@ -1,7 +1,7 @@
 """
 Account type schemas for multi-type account support (Sponsored Ads, DSP, AMC)
 """
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, model_validator
 from typing import Optional, Dict, Any, List, Literal
 from datetime import datetime
 from enum import Enum
@@ -165,11 +165,11 @@ class AccountRelationship(BaseModel):
     ] = Field(..., description="Type of relationship")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional relationship data")
 
-    @validator('parent_account_id')
-    def validate_not_self_reference(cls, v, values):
-        if 'child_account_id' in values and v == values['child_account_id']:
+    @model_validator(mode='after')
+    def validate_not_self_reference(self):
+        if self.parent_account_id == self.child_account_id:
             raise ValueError('Parent and child account IDs cannot be the same')
-        return v
+        return self
 
 
 class SetManagedRequest(BaseModel):
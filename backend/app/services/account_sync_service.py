@@ -1,7 +1,7 @@
 """
 Account Synchronization Service for batch operations with Amazon Ads API v3.0
 """
-import asyncio
+from collections import Counter
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timezone, timedelta
 import structlog
@@ -14,6 +14,9 @@ from app.core.exceptions import TokenRefreshError, RateLimitError
 
 logger = structlog.get_logger()
 
+# Rows per user_accounts page read / bulk upsert request during a sync
+SYNC_BATCH_SIZE = 1000
+
 
 class AccountSyncService:
     """
@@ -152,7 +155,8 @@ class AccountSyncService:
                 access_token=access_token,
                 include_regular=True,
                 include_dsp=True,
-                include_amc=True
+                include_amc=True,
+                use_cache=False
             )
 
             logger.info(
@@ -192,7 +196,8 @@ class AccountSyncService:
             try:
                 response = await account_service.list_ads_accounts(
                     access_token=access_token,
-                    next_token=next_token
+                    next_token=next_token,
+                    use_cache=False
                 )
 
                 accounts = response.get("adsAccounts", [])
@@ -208,13 +213,11 @@ class AccountSyncService:
                     has_next=bool(next_token)
                 )
 
-                # If no next token, we've fetched all accounts
+                # If no next token, we've fetched all accounts; pacing between
+                # pages is left to account_service's rate limiter
                 if not next_token:
                     break
 
-                # Small delay between pages to avoid rate limiting
-                await asyncio.sleep(0.5)
-
             except Exception as e:
                 logger.error(f"Error fetching accounts page {page_count}", error=str(e))
                 # If we have some accounts, return what we got
@@ -233,6 +236,9 @@ class AccountSyncService:
         """
         Process and store all account types in database
 
+        Existing rows are read once up front and each account type is written
+        in bulk, instead of a select plus insert/update per account.
+
         Args:
             user_id: Database user ID
             account_data: Dictionary with lists for each account type
@@ -240,100 +246,34 @@ class AccountSyncService:
         Returns:
             Dictionary with processing statistics
         """
-        created = 0
-        updated = 0
-        failed = 0
-        errors = []
+        errors: List[Dict] = []
         stats_by_type = {
             "advertising": {"created": 0, "updated": 0, "failed": 0},
             "dsp": {"created": 0, "updated": 0, "failed": 0},
             "amc": {"created": 0, "updated": 0, "failed": 0}
         }
 
-        # Process advertising accounts
-        for account in account_data.get("advertising_accounts", []):
-            try:
-                success, was_created = await self._upsert_advertising_account(user_id, account)
-                if success:
-                    if was_created:
-                        created += 1
-                        stats_by_type["advertising"]["created"] += 1
-                    else:
-                        updated += 1
-                        stats_by_type["advertising"]["updated"] += 1
-                else:
-                    failed += 1
-                    stats_by_type["advertising"]["failed"] += 1
-            except Exception as e:
-                failed += 1
-                stats_by_type["advertising"]["failed"] += 1
-                errors.append({
-                    "account_id": account.get("adsAccountId"),
-                    "type": "advertising",
-                    "error": str(e)
-                })
-                logger.error(
-                    "Failed to process advertising account",
-                    account_id=account.get("adsAccountId"),
-                    error=str(e)
-                )
+        existing_accounts = self._get_existing_accounts(user_id)
 
-        # Process DSP advertisers
-        for advertiser in account_data.get("dsp_advertisers", []):
-            try:
-                success, was_created = await self._upsert_dsp_advertiser(user_id, advertiser)
-                if success:
-                    if was_created:
-                        created += 1
-                        stats_by_type["dsp"]["created"] += 1
-                    else:
-                        updated += 1
-                        stats_by_type["dsp"]["updated"] += 1
-                else:
-                    failed += 1
-                    stats_by_type["dsp"]["failed"] += 1
-            except Exception as e:
-                failed += 1
-                stats_by_type["dsp"]["failed"] += 1
-                errors.append({
-                    "account_id": advertiser.get("advertiserId"),
-                    "type": "dsp",
-                    "error": str(e)
-                })
-                logger.error(
-                    "Failed to process DSP advertiser",
-                    advertiser_id=advertiser.get("advertiserId"),
-                    error=str(e)
-                )
-
-        # Process AMC instances
-        for instance in account_data.get("amc_instances", []):
-            try:
-                success, was_created = await self._upsert_amc_instance(user_id, instance)
-                if success:
-                    if was_created:
-                        created += 1
-                        stats_by_type["amc"]["created"] += 1
-                    else:
-                        updated += 1
-                        stats_by_type["amc"]["updated"] += 1
-                else:
-                    failed += 1
-                    stats_by_type["amc"]["failed"] += 1
-            except Exception as e:
-                failed += 1
-                stats_by_type["amc"]["failed"] += 1
-                errors.append({
-                    "account_id": instance.get("instanceId"),
-                    "type": "amc",
-                    "error": str(e)
-                })
-                logger.error(
-                    "Failed to process AMC instance",
-                    instance_id=instance.get("instanceId"),
-                    error=str(e)
-                )
+        for account_type, data_key, id_field, build_row in (
+            ("advertising", "advertising_accounts", "adsAccountId", self._build_advertising_row),
+            ("dsp", "dsp_advertisers", "advertiserId", self._build_dsp_row),
+            ("amc", "amc_instances", "instanceId", self._build_amc_row)
+        ):
+            self._sync_account_batch(
+                user_id=user_id,
+                account_type=account_type,
+                items=account_data.get(data_key, []),
+                id_field=id_field,
+                build_row=build_row,
+                existing_accounts=existing_accounts,
+                stats=stats_by_type[account_type],
+                errors=errors
+            )
 
+        created = sum(stats["created"] for stats in stats_by_type.values())
+        updated = sum(stats["updated"] for stats in stats_by_type.values())
+        failed = sum(stats["failed"] for stats in stats_by_type.values())
         total = len(account_data.get("advertising_accounts", [])) + \
                 len(account_data.get("dsp_advertisers", [])) + \
                 len(account_data.get("amc_instances", []))
@@ -356,6 +296,223 @@ class AccountSyncService:
             "stats_by_type": stats_by_type
         }
 
+    def _get_existing_accounts(self, user_id: str) -> Dict[str, Dict]:
+        """
+        Load the user's stored accounts keyed by Amazon account ID
+
+        Args:
+            user_id: Database user ID
+
+        Returns:
+            Dictionary of amazon_account_id to existing row
+        """
+        existing = {}
+        offset = 0
+
+        while True:
+            result = self.supabase.table("user_accounts").select(
+                "id, amazon_account_id, connected_at, metadata"
+            ).eq(
+                "user_id", user_id
+            ).order("id").range(offset, offset + SYNC_BATCH_SIZE - 1).execute()
+
+            rows = result.data or []
+            for row in rows:
+                existing[row["amazon_account_id"]] = row
+
+            if len(rows) < SYNC_BATCH_SIZE:
+                return existing
+            offset += SYNC_BATCH_SIZE
+
+    def _sync_account_batch(
+        self,
+        user_id: str,
+        account_type: str,
+        items: List[Dict],
+        id_field: str,
+        build_row,
+        existing_accounts: Dict[str, Dict],
+        stats: Dict[str, int],
+        errors: List[Dict]
+    ) -> None:
+        """
+        Build rows for one account type and write them in bulk
+
+        Rows already stored are upserted with their existing id, and new rows
+        are inserted without one so the database fills id and connected_at.
+
+        Args:
+            user_id: Database user ID
+            account_type: Account type being synced (advertising, dsp, amc)
+            items: Account data from API
+            id_field: API field holding the Amazon account ID
+            build_row: Builder turning API data into a user_accounts row
+            existing_accounts: Stored rows keyed by Amazon account ID
+            stats: Per-type counters updated in place
+            errors: Error list appended to in place
+        """
+        # amazon_account_id -> (row, occurrences); the API may repeat an ID
+        # and Postgres rejects one statement touching a row twice
+        pending: Dict[str, Tuple[Dict, int]] = {}
+
+        for item in items:
+            account_id: Optional[str] = item.get(id_field)
+            if not account_id:
+                self._record_failure(
+                    stats, errors, account_type, None, f"Missing {id_field}"
+                )
+                continue
+
+            try:
+                row = build_row(user_id, item)
+            except Exception as e:
+                self._record_failure(stats, errors, account_type, account_id, str(e))
+                continue
+
+            if account_id in pending:
+                previous, occurrences = pending[account_id]
+                row["metadata"] = {**previous["metadata"], **row["metadata"]}
+                pending[account_id] = (row, occurrences + 1)
+            else:
+                pending[account_id] = (row, 1)
+
+        updates: List[Tuple[str, Dict, int]] = []
+        inserts: List[Tuple[str, Dict, int]] = []
+        for account_id, (row, occurrences) in pending.items():
+            existing = existing_accounts.get(account_id)
+            if existing is None:
+                inserts.append((account_id, row, occurrences))
+            else:
+                self._merge_existing_row(row, existing)
+                updates.append((account_id, row, occurrences))
+
+        self._write_account_rows(user_id, account_type, updates, False, stats, errors)
+        self._write_account_rows(user_id, account_type, inserts, True, stats, errors)
+
+    def _write_account_rows(
+        self,
+        user_id: str,
+        account_type: str,
+        entries: List[Tuple[str, Dict, int]],
+        created: bool,
+        stats: Dict[str, int],
+        errors: List[Dict]
+    ) -> None:
+        """
+        Write rows in chunks, falling back to one row at a time if a chunk fails
+
+        Args:
+            user_id: Database user ID
+            account_type: Account type being synced (advertising, dsp, amc)
+            entries: (amazon_account_id, row, occurrences) to write
+            created: Whether the rows are new (insert) or stored (upsert)
+            stats: Per-type counters updated in place
+            errors: Error list appended to in place
+        """
+        for start in range(0, len(entries), SYNC_BATCH_SIZE):
+            chunk = entries[start:start + SYNC_BATCH_SIZE]
+            rows = [row for _, row, _ in chunk]
+            try:
+                table = self.supabase.table("user_accounts")
+                if created:
+                    result = table.insert(rows).execute()
+                else:
+                    result = table.upsert(
+                        rows, on_conflict="user_id,amazon_account_id"
+                    ).execute()
+                if not result.data:
+                    raise Exception("No rows returned from bulk write")
+            except Exception as e:
+                logger.warning(
+                    "Bulk account write failed, saving rows one at a time",
+                    account_type=account_type,
+                    batch_size=len(chunk),
+                    error=str(e)
+                )
+                for account_id, row, occurrences in chunk:
+                    try:
+                        success, was_created = self._save_account_row(user_id, row)
+                        error = "No rows returned"
+                    except Exception as row_error:
+                        success, was_created, error = False, False, str(row_error)
+                    if not success:
+                        self._record_failure(
+                            stats, errors, account_type, account_id, error, occurrences
+                        )
+                        continue
+                    self._count_written(stats, was_created, occurrences)
+                continue
+
+            for _, _, occurrences in chunk:
+                self._count_written(stats, created, occurrences)
+
+    @staticmethod
+    def _count_written(stats: Dict[str, int], was_created: bool, occurrences: int) -> None:
+        """
+        Count one written row in the per-type stats
+
+        Args:
+            stats: Per-type counters updated in place
+            was_created: Whether the row was inserted
+            occurrences: How many API items were folded into the row
+        """
+        stats["created" if was_created else "updated"] += 1
+        # Repeated IDs were folded into one row; count them as updates
+        stats["updated"] += occurrences - 1
+
+    @staticmethod
+    def _record_failure(
+        stats: Dict[str, int],
+        errors: List[Dict],
+        account_type: str,
+        account_id: Optional[str],
+        error: str,
+        occurrences: int = 1
+    ) -> None:
+        """
+        Count a failed account and record its error
+
+        Args:
+            stats: Per-type counters updated in place
+            errors: Error list appended to in place
+            account_type: Account type being synced
+            account_id: Amazon account ID, if the item had one
+            error: Error message
+            occurrences: How many API items the failure covers
+        """
+        stats["failed"] += occurrences
+        errors.append({
+            "account_id": account_id,
+            "type": account_type,
+            "error": error
+        })
+        logger.error(
+            "Failed to process account",
+            account_type=account_type,
+            account_id=account_id,
+            error=error
+        )
+
+    @staticmethod
+    def _merge_existing_row(row: Dict, existing: Optional[Dict]) -> None:
+        """
+        Carry identity and metadata from a stored row into a freshly built one
+
+        New rows are left without id and connected_at so the database
+        defaults fill them.
+
+        Args:
+            row: Row built from API data, updated in place
+            existing: Stored row for the same account, if any
+        """
+        if existing is None:
+            return
+
+        row["id"] = existing["id"]
+        row["connected_at"] = existing.get("connected_at")
+        # Preserve existing metadata and merge with new
+        row["metadata"] = {**(existing.get("metadata") or {}), **row["metadata"]}
+
     async def _process_accounts(
         self,
         user_id: str,
@@ -408,20 +565,16 @@ class AccountSyncService:
             "errors": errors if errors else None
         }
 
-    async def _upsert_advertising_account(
-        self,
-        user_id: str,
-        account_data: Dict
-    ) -> Tuple[bool, bool]:
+    def _build_advertising_row(self, user_id: str, account_data: Dict) -> Dict:
         """
-        Create or update a single advertising account
+        Build the user_accounts row for an advertising account
 
         Args:
             user_id: Database user ID
             account_data: Account data from API
 
         Returns:
-            Tuple of (success, was_created)
+            user_accounts row without id/connected_at
         """
         # Extract data for v3.0 format
         amazon_account_id = account_data.get("adsAccountId")
@@ -437,13 +590,6 @@ class AccountSyncService:
         }
         api_status = account_data.get("status", "CREATED")
 
-        # Check if account exists
-        existing = self.supabase.table("user_accounts").select("*").eq(
-            "user_id", user_id
-        ).eq(
-            "amazon_account_id", amazon_account_id
-        ).execute()
-
         account_dict = {
             "user_id": user_id,
             "account_name": account_data.get("accountName", "Unknown"),
@@ -462,45 +608,19 @@ class AccountSyncService:
             }
         }
 
-        if not existing.data:
-            # Create new account
-            account_dict["id"] = str(uuid4())
-            account_dict["connected_at"] = datetime.now(timezone.utc).isoformat()
-
-            result = self.supabase.table("user_accounts").insert(account_dict).execute()
-            return (bool(result.data), True)
-        else:
-            # Update existing account
-            # Preserve existing metadata and merge with new
-            existing_metadata = existing.data[0].get("metadata", {})
-            account_dict["metadata"] = {**existing_metadata, **account_dict["metadata"]}
-
-            result = self.supabase.table("user_accounts").update(
-                account_dict
-            ).eq("id", existing.data[0]["id"]).execute()
-
-            return (bool(result.data), False)
+        return account_dict
 
-    async def _upsert_dsp_advertiser(
-        self,
-        user_id: str,
-        advertiser_data: Dict
-    ) -> Tuple[bool, bool]:
+    def _build_dsp_row(self, user_id: str, advertiser_data: Dict) -> Dict:
         """
-        Create or update a DSP advertiser
+        Build the user_accounts row for a DSP advertiser
 
         Args:
             user_id: Database user ID
             advertiser_data: DSP advertiser data from API
 
         Returns:
-            Tuple of (success, was_created)
+            user_accounts row without id/connected_at
         """
-        # Initialize Supabase client if needed
-        if not self.supabase:
-            from app.db.base import get_supabase_service_client
-            self.supabase = get_supabase_service_client()
-
         amazon_account_id = advertiser_data.get("advertiserId")
 
         # Handle both old and new response formats
@@ -519,13 +639,6 @@ class AccountSyncService:
         # Status might not be in new format, default to active
         api_status = advertiser_data.get("advertiserStatus", "ACTIVE")
 
-        # Check if account exists
-        existing = self.supabase.table("user_accounts").select("*").eq(
-            "user_id", user_id
-        ).eq(
-            "amazon_account_id", amazon_account_id
-        ).execute()
-
         account_dict = {
             "user_id": user_id,
             "account_name": advertiser_name,
@@ -552,38 +665,18 @@ class AccountSyncService:
             }
         }
 
-        if not existing.data:
-            # Create new account
-            account_dict["id"] = str(uuid4())
-            account_dict["connected_at"] = datetime.now(timezone.utc).isoformat()
+        return account_dict
 
-            result = self.supabase.table("user_accounts").insert(account_dict).execute()
-            return (bool(result.data), True)
-        else:
-            # Update existing account
-            existing_metadata = existing.data[0].get("metadata", {})
-            account_dict["metadata"] = {**existing_metadata, **account_dict["metadata"]}
-
-            result = self.supabase.table("user_accounts").update(
-                account_dict
-            ).eq("id", existing.data[0]["id"]).execute()
-
-            return (bool(result.data), False)
-
-    async def _upsert_amc_instance(
-        self,
-        user_id: str,
-        instance_data: Dict
-    ) -> Tuple[bool, bool]:
+    def _build_amc_row(self, user_id: str, instance_data: Dict) -> Dict:
         """
-        Create or update an AMC instance account
+        Build the user_accounts row for an AMC instance
 
         Args:
             user_id: Database user ID
             instance_data: AMC instance data from API
 
         Returns:
-            Tuple of (success, was_created)
+            user_accounts row without id/connected_at
         """
         amazon_account_id = instance_data.get("instanceId")
 
@@ -599,13 +692,6 @@ class AccountSyncService:
         linked_advertisers = instance_data.get("advertisers", [])
         first_advertiser = linked_advertisers[0] if linked_advertisers else {}
 
-        # Check if account exists
-        existing = self.supabase.table("user_accounts").select("*").eq(
-            "user_id", user_id
-        ).eq(
-            "amazon_account_id", amazon_account_id
-        ).execute()
-
         account_dict = {
             "user_id": user_id,
             "account_name": instance_data.get("instanceName", "Unknown AMC"),
@@ -626,23 +712,99 @@ class AccountSyncService:
             }
         }
 
-        if not existing.data:
-            # Create new account
-            account_dict["id"] = str(uuid4())
-            account_dict["connected_at"] = datetime.now(timezone.utc).isoformat()
+        return account_dict
 
+    async def _upsert_advertising_account(
+        self,
+        user_id: str,
+        account_data: Dict
+    ) -> Tuple[bool, bool]:
+        """
+        Create or update a single advertising account
+
+        Args:
+            user_id: Database user ID
+            account_data: Account data from API
+
+        Returns:
+            Tuple of (success, was_created)
+        """
+        account_dict = self._build_advertising_row(user_id, account_data)
+        return self._save_account_row(user_id, account_dict)
+
+    async def _upsert_dsp_advertiser(
+        self,
+        user_id: str,
+        advertiser_data: Dict
+    ) -> Tuple[bool, bool]:
+        """
+        Create or update a DSP advertiser
+
+        Args:
+            user_id: Database user ID
+            advertiser_data: DSP advertiser data from API
+
+        Returns:
+            Tuple of (success, was_created)
+        """
+        # Initialize Supabase client if needed
+        if not self.supabase:
+            from app.db.base import get_supabase_service_client
+            self.supabase = get_supabase_service_client()
+
+        account_dict = self._build_dsp_row(user_id, advertiser_data)
+        return self._save_account_row(user_id, account_dict)
+
+    async def _upsert_amc_instance(
+        self,
+        user_id: str,
+        instance_data: Dict
+    ) -> Tuple[bool, bool]:
+        """
+        Create or update an AMC instance account
+
+        Args:
+            user_id: Database user ID
+            instance_data: AMC instance data from API
+
+        Returns:
+            Tuple of (success, was_created)
+        """
+        account_dict = self._build_amc_row(user_id, instance_data)
+        return self._save_account_row(user_id, account_dict)
+
+    def _save_account_row(self, user_id: str, account_dict: Dict) -> Tuple[bool, bool]:
+        """
+        Insert or update a single built account row
+
+        Args:
+            user_id: Database user ID
+            account_dict: Row from one of the _build_*_row methods
+
+        Returns:
+            Tuple of (success, was_created)
+        """
+        # Check if account exists
+        existing = self.supabase.table("user_accounts").select("*").eq(
+            "user_id", user_id
+        ).eq(
+            "amazon_account_id", account_dict["amazon_account_id"]
+        ).execute()
+
+        existing_row = existing.data[0] if existing.data else None
+        self._merge_existing_row(account_dict, existing_row)
+
+        if existing_row is None:
+            # Create new account
             result = self.supabase.table("user_accounts").insert(account_dict).execute()
             return (bool(result.data), True)
-        else:
-            # Update existing account
-            existing_metadata = existing.data[0].get("metadata", {})
-            account_dict["metadata"] = {**existing_metadata, **account_dict["metadata"]}
 
-            result = self.supabase.table("user_accounts").update(
-                account_dict
-            ).eq("id", existing.data[0]["id"]).execute()
+        # Update existing account
+        result = self.supabase.table("user_accounts").update(
+            account_dict
+        ).eq("id", existing_row["id"]).execute()
 
-            return (bool(result.data), False)
+        return (bool(result.data), False)
 
     async def _should_sync_accounts(self, user_id: str) -> bool:
         """
@@ -755,12 +917,16 @@ class AccountSyncService:
             "status"
         ).eq("user_id", user_id).execute()
 
+        accounts = accounts_result.data or []
+        # Single pass over the rows instead of one scan per status
+        status_counts = Counter(a["status"] for a in accounts)
+
         account_stats = {
-            "total": len(accounts_result.data) if accounts_result.data else 0,
-            "active": sum(1 for a in accounts_result.data if a["status"] == "active"),
-            "partial": sum(1 for a in accounts_result.data if a["status"] == "partial"),
-            "disabled": sum(1 for a in accounts_result.data if a["status"] == "disabled"),
-            "pending": sum(1 for a in accounts_result.data if a["status"] == "pending")
+            "total": len(accounts),
+            "active": status_counts["active"],
+            "partial": status_counts["partial"],
+            "disabled": status_counts["disabled"],
+            "pending": status_counts["pending"]
         }
 
         return {
@@ -8,6 +8,7 @@ import hashlib
 import hmac
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
+from fastapi.concurrency import run_in_threadpool
 import structlog
 from svix.webhooks import Webhook, WebhookVerificationError
 from jwt.algorithms import RSAAlgorithm
@@ -18,6 +19,9 @@ from app.services.user_service import UserService
 
 logger = structlog.get_logger()
 
+# Headers Svix signs webhook deliveries with
+SVIX_HEADERS = ("svix-id", "svix-timestamp", "svix-signature")
+
 
 class ClerkService:
     """Service for Clerk authentication operations"""
@@ -30,6 +34,19 @@ class ClerkService:
         self.user_service = UserService()
         self._jwks_cache = None
         self._jwks_cache_time = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the shared keep-alive HTTP client for Clerk requests"""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient()
+        return self._http_client
+
+    async def close(self):
+        """Close the shared HTTP client"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
     
     async def verify_session_token(self, token: str) -> Optional[Dict[str, Any]]:
         """
@@ -50,45 +67,10 @@ class ClerkService:
                 logger.error("Failed to fetch JWKS")
                 return None
 
-            logger.debug(f"JWKS fetched, contains {len(jwks.get('keys', []))} keys")
-
-            # Decode without verification first to get the kid
-            unverified = jwt.decode(token, options={"verify_signature": False})
-            kid = jwt.get_unverified_header(token).get("kid")
-
-            logger.debug(f"Token kid: {kid}")
-            logger.debug(f"Token claims: sub={unverified.get('sub')}, exp={unverified.get('exp')}")
-
-            # Find the matching key
-            public_key = None
-            for key in jwks.get("keys", []):
-                if key.get("kid") == kid:
-                    public_key = RSAAlgorithm.from_jwk(json.dumps(key))
-                    logger.debug(f"Found matching key for kid: {kid}")
-                    break
-
-            if not public_key:
-                logger.error(f"No matching key found for kid: {kid}")
-                logger.debug(f"Available kids: {[k.get('kid') for k in jwks.get('keys', [])]}")
-                return None
-
-            # Verify the token with the public key
-            decoded = jwt.decode(
-                token,
-                public_key,
-                algorithms=["RS256"],
-                options={"verify_signature": True}
-            )
-
-            logger.debug("Token signature verified successfully")
-
-            # Check expiration
-            if decoded.get("exp", 0) < datetime.utcnow().timestamp():
-                logger.warning(f"Token expired: exp={decoded.get('exp')}, now={datetime.utcnow().timestamp()}")
-                return None
+            logger.debug("JWKS fetched", key_count=len(jwks.get("keys", [])))
 
-            logger.debug(f"Token verified successfully for user: {decoded.get('sub')}")
-            return decoded
+            # Signature verification is CPU-bound, keep it off the event loop
+            return await run_in_threadpool(self.verify_jwt, token, jwks)
 
         except jwt.ExpiredSignatureError:
             logger.warning("Session token expired")
@@ -100,6 +82,59 @@ class ClerkService:
             logger.error(f"Error verifying session token: {str(e)}", exc_info=True)
             return None
     
+    def verify_jwt(self, token: str, jwks: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Verify a session token's signature and expiry against the JWKS
+
+        Synchronous so it can run in the threadpool.
+
+        Args:
+            token: JWT session token from Clerk
+            jwks: Clerk JWKS data
+
+        Returns:
+            Decoded token payload if valid, None otherwise
+
+        Raises:
+            jwt.InvalidTokenError: If the token cannot be decoded or verified
+        """
+        # Decode without verification first to get the kid
+        unverified = jwt.decode(token, options={"verify_signature": False})
+        kid = jwt.get_unverified_header(token).get("kid")
+
+        logger.debug("Token claims", kid=kid, sub=unverified.get("sub"), exp=unverified.get("exp"))
+
+        # Find the matching key
+        public_key = None
+        for key in jwks.get("keys", []):
+            if key.get("kid") == kid:
+                public_key = RSAAlgorithm.from_jwk(json.dumps(key))
+                logger.debug("Found matching key", kid=kid)
+                break
+
+        if not public_key:
+            logger.error(f"No matching key found for kid: {kid}")
+            logger.debug("Available kids", kids=[k.get("kid") for k in jwks.get("keys", [])])
+            return None
+
+        # Verify the token with the public key
+        decoded = jwt.decode(
+            token,
+            public_key,
+            algorithms=["RS256"],
+            options={"verify_signature": True}
+        )
+
+        logger.debug("Token signature verified successfully")
+
+        # Check expiration
+        if decoded.get("exp", 0) < datetime.utcnow().timestamp():
+            logger.warning(f"Token expired: exp={decoded.get('exp')}, now={datetime.utcnow().timestamp()}")
+            return None
+
+        logger.debug("Token verified successfully", sub=decoded.get("sub"))
+        return decoded
+    
     async def get_jwks(self) -> Optional[Dict[str, Any]]:
         """
         Fetch JWKS from Clerk's endpoint
@@ -165,17 +200,17 @@ class ClerkService:
             jwks_url = f"https://{instance_id}.clerk.accounts.dev/.well-known/jwks.json"
             logger.debug(f"JWKS URL: {jwks_url}")
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(jwks_url)
-                if response.status_code == 200:
-                    self._jwks_cache = response.json()
-                    self._jwks_cache_time = datetime.utcnow()
-                    logger.debug(f"JWKS fetched successfully, {len(self._jwks_cache.get('keys', []))} keys")
-                    return self._jwks_cache
-                else:
-                    logger.error(f"Failed to fetch JWKS: {response.status_code}")
-                    logger.error(f"Response: {response.text}")
-                    return None
+            client = self._get_http_client()
+            response = await client.get(jwks_url)
+            if response.status_code == 200:
+                self._jwks_cache = response.json()
+                self._jwks_cache_time = datetime.utcnow()
+                logger.debug(f"JWKS fetched successfully, {len(self._jwks_cache.get('keys', []))} keys")
+                return self._jwks_cache
+            else:
+                logger.error(f"Failed to fetch JWKS: {response.status_code}")
+                logger.error(f"Response: {response.text}")
+                return None
         except Exception as e:
             logger.error(f"Error fetching JWKS: {str(e)}", exc_info=True)
             return None
@@ -195,40 +230,40 @@ class ClerkService:
             return None
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.api_url}/users/{clerk_user_id}",
-                    headers={
-                        "Authorization": f"Bearer {self.secret_key}",
-                        "Content-Type": "application/json"
-                    }
-                )
+            client = self._get_http_client()
+            response = await client.get(
+                f"{self.api_url}/users/{clerk_user_id}",
+                headers={
+                    "Authorization": f"Bearer {self.secret_key}",
+                    "Content-Type": "application/json"
+                }
+            )
+            
+            if response.status_code == 200:
+                user_data = response.json()
+                
+                # Extract primary email
+                email = None
+                for email_obj in user_data.get("email_addresses", []):
+                    if email_obj.get("verification", {}).get("status") == "verified":
+                        email = email_obj.get("email_address")
+                        break
                 
-                if response.status_code == 200:
-                    user_data = response.json()
-                    
-                    # Extract primary email
-                    email = None
-                    for email_obj in user_data.get("email_addresses", []):
-                        if email_obj.get("verification", {}).get("status") == "verified":
-                            email = email_obj.get("email_address")
-                            break
-                    
-                    if not email:
-                        logger.error(f"No verified email found for user {clerk_user_id}")
-                        return None
-                    
-                    return UserCreate(
-                        clerk_user_id=user_data["id"],
-                        email=email,
-                        first_name=user_data.get("first_name"),
-                        last_name=user_data.get("last_name"),
-                        profile_image_url=user_data.get("profile_image_url")
-                    )
-                else:
-                    logger.error(f"Failed to get user from Clerk: {response.status_code}")
+                if not email:
+                    logger.error(f"No verified email found for user {clerk_user_id}")
                     return None
-                    
+                
+                return UserCreate(
+                    clerk_user_id=user_data["id"],
+                    email=email,
+                    first_name=user_data.get("first_name"),
+                    last_name=user_data.get("last_name"),
+                    profile_image_url=user_data.get("profile_image_url")
+                )
+            else:
+                logger.error(f"Failed to get user from Clerk: {response.status_code}")
+                return None
+                
         except Exception as e:
             logger.error(f"Error fetching user from Clerk: {str(e)}")
             return None
@@ -277,22 +312,22 @@ class ClerkService:
             return []
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.api_url}/users",
-                    params={"limit": limit, "offset": offset},
-                    headers={
-                        "Authorization": f"Bearer {self.secret_key}",
-                        "Content-Type": "application/json"
-                    }
-                )
+            client = self._get_http_client()
+            response = await client.get(
+                f"{self.api_url}/users",
+                params={"limit": limit, "offset": offset},
+                headers={
+                    "Authorization": f"Bearer {self.secret_key}",
+                    "Content-Type": "application/json"
+                }
+            )
+            
+            if response.status_code == 200:
+                return response.json()
+            else:
+                logger.error(f"Failed to list users from Clerk: {response.status_code}")
+                return []
                 
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    logger.error(f"Failed to list users from Clerk: {response.status_code}")
-                    return []
-                    
         except Exception as e:
             logger.error(f"Error listing users from Clerk: {str(e)}")
             return []
@@ -326,11 +361,7 @@ class ClerkWebhookHandler:
             wh = Webhook(self.webhook_secret)
             
             # Extract required headers
-            svix_headers = {
-                "svix-id": headers.get("svix-id", ""),
-                "svix-timestamp": headers.get("svix-timestamp", ""),
-                "svix-signature": headers.get("svix-signature", "")
-            }
+            svix_headers = {name: headers.get(name, "") for name in SVIX_HEADERS}
             
             # Verify the webhook
             wh.verify(payload, svix_headers)
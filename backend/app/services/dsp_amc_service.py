@@ -1,6 +1,7 @@
 """
 Amazon DSP and AMC Account Management Service
 """
+import asyncio
 import httpx
 from typing import Dict, List, Optional
 import structlog
@@ -8,10 +9,14 @@ from datetime import datetime, timezone
 
 from app.config import settings
 from app.core.exceptions import TokenRefreshError, RateLimitError
-from app.core.rate_limiter import ExponentialBackoffRateLimiter
+from app.core.rate_limiter import ExponentialBackoffRateLimiter, RateLimitError as RetryableRateLimit
+from app.services.account_service import AMAZON_HTTP_LIMITS, decode_error_body
 
 logger = structlog.get_logger()
 
+# Profiles queried at once when fetching DSP advertisers for every profile
+DSP_PROFILE_CONCURRENCY = 8
+
 
 class DSPAMCService:
     """Handle Amazon DSP and AMC account operations"""
@@ -20,6 +25,19 @@ class DSPAMCService:
         """Initialize DSP/AMC service"""
         self.base_url = "https://advertising-api.amazon.com"
         self.rate_limiter = ExponentialBackoffRateLimiter()
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the shared keep-alive HTTP client for Amazon DSP/AMC requests"""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(limits=AMAZON_HTTP_LIMITS, http2=True)
+        return self._http_client
+
+    async def close(self):
+        """Close the shared HTTP client"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
 
     async def list_dsp_advertisers(
         self,
@@ -93,66 +111,66 @@ class DSPAMCService:
         url = f"{self.base_url}/dsp/advertisers"
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    headers=headers,
-                    params=params,
-                    timeout=30.0
-                )
-
-                if response.status_code == 401:
-                    logger.error("Unauthorized - token may be expired")
-                    raise TokenRefreshError("Access token expired or invalid")
-
-                if response.status_code == 403:
-                    logger.warning(
-                        "User lacks DSP permissions - this is normal for non-DSP accounts",
-                        profile_id=profile_id
-                    )
-                    # Return empty response structure
-                    return {"totalResults": 0, "response": []}
-
-                if response.status_code == 429:
-                    retry_after = response.headers.get("Retry-After", "60")
-                    logger.warning("Rate limit exceeded", retry_after=retry_after)
-                    raise RateLimitError(int(retry_after))
-
-                if response.status_code != 200:
-                    error_data = response.json() if response.text else {}
-                    logger.error(
-                        "Failed to list DSP advertisers",
-                        status_code=response.status_code,
-                        error=error_data
-                    )
-                    raise Exception(f"API Error: {response.status_code}")
-
-                data = response.json()
-
-                # Handle both possible response formats
-                # Standard format: {"totalResults": n, "response": [...]}
-                # Legacy format: {"advertisers": [...]}
-                if "response" in data:
-                    result = data  # Already in correct format
-                elif "advertisers" in data:
-                    # Convert legacy format
-                    advertisers = data.get("advertisers", [])
-                    result = {
-                        "totalResults": len(advertisers),
-                        "response": advertisers
-                    }
-                else:
-                    # Unknown format, return empty
-                    result = {"totalResults": 0, "response": []}
-
-                logger.info(
-                    "Successfully retrieved DSP advertisers",
-                    total_results=result.get("totalResults", 0),
-                    returned_count=len(result.get("response", [])),
+            client = self._get_http_client()
+            response = await client.get(
+                url,
+                headers=headers,
+                params=params,
+                timeout=30.0
+            )
+
+            if response.status_code == 401:
+                logger.error("Unauthorized - token may be expired")
+                raise TokenRefreshError("Access token expired or invalid")
+
+            if response.status_code == 403:
+                logger.warning(
+                    "User lacks DSP permissions - this is normal for non-DSP accounts",
                     profile_id=profile_id
                 )
+                # Return empty response structure
+                return {"totalResults": 0, "response": []}
+
+            if response.status_code == 429:
+                retry_after = response.headers.get("Retry-After", "60")
+                logger.warning("Rate limit exceeded", retry_after=retry_after)
+                raise RateLimitError(int(retry_after))
+
+            if response.status_code != 200:
+                error_data = decode_error_body(response)
+                logger.error(
+                    "Failed to list DSP advertisers",
+                    status_code=response.status_code,
+                    error=error_data
+                )
+                raise Exception(f"API Error: {response.status_code}")
+
+            data = response.json()
+
+            # Handle both possible response formats
+            # Standard format: {"totalResults": n, "response": [...]}
+            # Legacy format: {"advertisers": [...]}
+            if "response" in data:
+                result = data  # Already in correct format
+            elif "advertisers" in data:
+                # Convert legacy format
+                advertisers = data.get("advertisers", [])
+                result = {
+                    "totalResults": len(advertisers),
+                    "response": advertisers
+                }
+            else:
+                # Unknown format, return empty
+                result = {"totalResults": 0, "response": []}
+
+            logger.info(
+                "Successfully retrieved DSP advertisers",
+                total_results=result.get("totalResults", 0),
+                returned_count=len(result.get("response", [])),
+                profile_id=profile_id
+            )
 
-                return result
+            return result
 
         except httpx.TimeoutException:
             logger.error("DSP advertisers request timeout")
@@ -208,48 +226,48 @@ class DSPAMCService:
         url = f"{self.base_url}/amc/instances"
 
         try:
-            async with httpx.AsyncClient() as client:
-                # First try without parameters
-                response = await client.get(
-                    url,
-                    headers=headers,
-                    timeout=30.0
+            client = self._get_http_client()
+            # First try without parameters
+            response = await client.get(
+                url,
+                headers=headers,
+                timeout=30.0
+            )
+
+            if response.status_code == 401:
+                logger.error("Unauthorized - token may be expired or missing amc:read scope")
+                raise TokenRefreshError("Access token expired or missing AMC scope")
+
+            if response.status_code == 403:
+                logger.warning(
+                    "User lacks AMC permissions - AMC requires special provisioning"
                 )
+                # Return empty list but indicate it's due to permissions
+                return []  # User doesn't have AMC access
+
+            if response.status_code == 429:
+                retry_after = response.headers.get("Retry-After", "60")
+                logger.warning("Rate limit exceeded", retry_after=retry_after)
+                raise RateLimitError(int(retry_after))
+
+            if response.status_code != 200:
+                error_data = decode_error_body(response)
+                logger.error(
+                    "Failed to list AMC instances",
+                    status_code=response.status_code,
+                    error=error_data
+                )
+                raise Exception(f"API Error: {response.status_code}")
 
-                if response.status_code == 401:
-                    logger.error("Unauthorized - token may be expired or missing amc:read scope")
-                    raise TokenRefreshError("Access token expired or missing AMC scope")
-
-                if response.status_code == 403:
-                    logger.warning(
-                        "User lacks AMC permissions - AMC requires special provisioning"
-                    )
-                    # Return empty list but indicate it's due to permissions
-                    return []  # User doesn't have AMC access
-
-                if response.status_code == 429:
-                    retry_after = response.headers.get("Retry-After", "60")
-                    logger.warning("Rate limit exceeded", retry_after=retry_after)
-                    raise RateLimitError(int(retry_after))
-
-                if response.status_code != 200:
-                    error_data = response.json() if response.text else {}
-                    logger.error(
-                        "Failed to list AMC instances",
-                        status_code=response.status_code,
-                        error=error_data
-                    )
-                    raise Exception(f"API Error: {response.status_code}")
-
-                data = response.json()
-                instances = data.get("instances", [])
+            data = response.json()
+            instances = data.get("instances", [])
 
-                logger.info(
-                    "Successfully retrieved AMC instances",
-                    instance_count=len(instances)
-                )
+            logger.info(
+                "Successfully retrieved AMC instances",
+                instance_count=len(instances)
+            )
 
-                return instances
+            return instances
 
         except httpx.TimeoutException:
             logger.error("AMC instances request timeout")
@@ -286,35 +304,35 @@ class DSPAMCService:
         url = f"{self.base_url}/dsp/advertisers/{advertiser_id}"
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    headers=headers,
-                    timeout=30.0
+            client = self._get_http_client()
+            response = await client.get(
+                url,
+                headers=headers,
+                timeout=30.0
+            )
+
+            if response.status_code == 404:
+                logger.error("DSP advertiser not found", advertiser_id=advertiser_id)
+                raise Exception(f"Advertiser {advertiser_id} not found")
+
+            if response.status_code != 200:
+                error_data = decode_error_body(response)
+                logger.error(
+                    "Failed to get DSP advertiser details",
+                    advertiser_id=advertiser_id,
+                    status_code=response.status_code,
+                    error=error_data
                 )
+                raise Exception(f"API Error: {response.status_code}")
 
-                if response.status_code == 404:
-                    logger.error("DSP advertiser not found", advertiser_id=advertiser_id)
-                    raise Exception(f"Advertiser {advertiser_id} not found")
-
-                if response.status_code != 200:
-                    error_data = response.json() if response.text else {}
-                    logger.error(
-                        "Failed to get DSP advertiser details",
-                        advertiser_id=advertiser_id,
-                        status_code=response.status_code,
-                        error=error_data
-                    )
-                    raise Exception(f"API Error: {response.status_code}")
+            advertiser = response.json()
 
-                advertiser = response.json()
+            logger.info(
+                "Successfully retrieved DSP advertiser details",
+                advertiser_id=advertiser_id
+            )
 
-                logger.info(
-                    "Successfully retrieved DSP advertiser details",
-                    advertiser_id=advertiser_id
-                )
-
-                return advertiser
+            return advertiser
 
         except httpx.TimeoutException:
             logger.error("DSP advertiser details request timeout")
@@ -400,62 +418,62 @@ class DSPAMCService:
         url = f"{self.base_url}/dsp/v1/seats/advertisers/current/list"
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    headers=headers,
-                    json=payload,
-                    timeout=30.0
+            client = self._get_http_client()
+            response = await client.post(
+                url,
+                headers=headers,
+                json=payload,
+                timeout=30.0
+            )
+
+            if response.status_code == 401:
+                logger.error("Unauthorized - token may be expired")
+                raise TokenRefreshError("Access token expired or invalid")
+
+            if response.status_code == 403:
+                logger.warning(
+                    "User lacks DSP Seats API permissions",
+                    advertiser_id=advertiser_id
                 )
+                # Return empty result indicating permission issue
+                return {
+                    "advertiserSeats": [],
+                    "error": "Insufficient permissions for DSP Seats API"
+                }
 
-                if response.status_code == 401:
-                    logger.error("Unauthorized - token may be expired")
-                    raise TokenRefreshError("Access token expired or invalid")
-
-                if response.status_code == 403:
-                    logger.warning(
-                        "User lacks DSP Seats API permissions",
-                        advertiser_id=advertiser_id
-                    )
-                    # Return empty result indicating permission issue
-                    return {
-                        "advertiserSeats": [],
-                        "error": "Insufficient permissions for DSP Seats API"
-                    }
-
-                if response.status_code == 429:
-                    retry_after = response.headers.get("Retry-After", "60")
-                    logger.warning("Rate limit exceeded", retry_after=retry_after)
-                    raise RateLimitError(int(retry_after))
-
-                if response.status_code == 400:
-                    error_data = response.json() if response.text else {}
-                    logger.error(
-                        "Bad request - check advertiser ID and parameters",
-                        advertiser_id=advertiser_id,
-                        error=error_data
-                    )
-                    raise ValueError(f"Invalid request: {error_data}")
-
-                if response.status_code != 200:
-                    error_data = response.json() if response.text else {}
-                    logger.error(
-                        "Failed to list advertiser seats",
-                        status_code=response.status_code,
-                        error=error_data
-                    )
-                    raise Exception(f"API Error: {response.status_code}")
-
-                data = response.json()
+            if response.status_code == 429:
+                retry_after = response.headers.get("Retry-After", "60")
+                logger.warning("Rate limit exceeded", retry_after=retry_after)
+                raise RateLimitError(int(retry_after))
 
-                logger.info(
-                    "Successfully retrieved advertiser seats",
+            if response.status_code == 400:
+                error_data = decode_error_body(response)
+                logger.error(
+                    "Bad request - check advertiser ID and parameters",
                     advertiser_id=advertiser_id,
-                    seat_count=len(data.get("advertiserSeats", [])),
-                    has_more=bool(data.get("nextToken"))
+                    error=error_data
+                )
+                raise ValueError(f"Invalid request: {error_data}")
+
+            if response.status_code != 200:
+                error_data = decode_error_body(response)
+                logger.error(
+                    "Failed to list advertiser seats",
+                    status_code=response.status_code,
+                    error=error_data
                 )
+                raise Exception(f"API Error: {response.status_code}")
 
-                return data
+            data = response.json()
+
+            logger.info(
+                "Successfully retrieved advertiser seats",
+                advertiser_id=advertiser_id,
+                seat_count=len(data.get("advertiserSeats", [])),
+                has_more=bool(data.get("nextToken"))
+            )
+
+            return data
 
         except httpx.TimeoutException:
             logger.error("Advertiser seats request timeout")
@@ -469,7 +487,8 @@ class DSPAMCService:
         access_token: str,
         include_regular: bool = True,
         include_dsp: bool = True,
-        include_amc: bool = True
+        include_amc: bool = True,
+        use_cache: bool = True
     ) -> Dict[str, List[Dict]]:
         """
         Retrieve all account types in parallel
@@ -482,6 +501,8 @@ class DSPAMCService:
             include_regular: Include regular advertising accounts
             include_dsp: Include DSP advertisers
             include_amc: Include AMC instances
+            use_cache: Whether cached account/profile listings may be used;
+                sync paths pass False so they store Amazon's current state
 
         Returns:
             Dictionary with keys:
@@ -489,19 +510,18 @@ class DSPAMCService:
             - dsp_advertisers: DSP advertisers
             - amc_instances: AMC instances
         """
-        import asyncio
         from app.services.account_service import account_service
 
         tasks = []
         task_names = []
 
         if include_regular:
-            tasks.append(account_service.list_ads_accounts(access_token))
+            tasks.append(account_service.list_ads_accounts(access_token, use_cache=use_cache))
             task_names.append("advertising_accounts")
 
         # For DSP, we need to get profiles first to get profile IDs
         if include_dsp:
-            tasks.append(self._fetch_all_dsp_advertisers(access_token))
+            tasks.append(self._fetch_all_dsp_advertisers(access_token, use_cache=use_cache))
             task_names.append("dsp_advertisers")
 
         if include_amc:
@@ -537,7 +557,11 @@ class DSPAMCService:
 
         return account_data
 
-    async def _fetch_all_dsp_advertisers(self, access_token: str) -> List[Dict]:
+    async def _fetch_all_dsp_advertisers(
+        self,
+        access_token: str,
+        use_cache: bool = True
+    ) -> List[Dict]:
         """
         Fetch DSP advertisers for all available profiles
 
@@ -548,6 +572,7 @@ class DSPAMCService:
 
         Args:
             access_token: Valid access token
+            use_cache: Whether a cached profile listing may be used
 
         Returns:
             List of all DSP advertisers across all profiles
@@ -556,7 +581,9 @@ class DSPAMCService:
 
         try:
             # First get all profiles
-            profiles_response = await account_service.list_profiles(access_token)
+            profiles_response = await account_service.list_profiles(
+                access_token, use_cache=use_cache
+            )
 
             # Handle both list and dict response formats
             if isinstance(profiles_response, list):
@@ -571,21 +598,30 @@ class DSPAMCService:
                 logger.info("No profiles found, cannot fetch DSP advertisers")
                 return []
 
-            # Fetch DSP advertisers for each profile
-            all_dsp_advertisers = []
-
-            for profile in profiles:
-                profile_id = str(profile.get("profileId"))
-                if not profile_id:
-                    continue
+            # Fetch DSP advertisers for each profile, a bounded number at a time
+            semaphore = asyncio.Semaphore(DSP_PROFILE_CONCURRENCY)
 
+            async def list_profile_advertisers(profile_id: str) -> Dict:
                 try:
-                    # Call with the fixed signature
-                    result = await self.list_dsp_advertisers(
+                    return await self.list_dsp_advertisers(
                         access_token=access_token,
                         profile_id=profile_id,
                         count=100  # Max per request
                     )
+                except RateLimitError as e:
+                    # Hand 429s to the limiter so it waits out Retry-After
+                    raise RetryableRateLimit(e.retry_after) from e
+
+            async def fetch_profile(profile: Dict) -> List[Dict]:
+                profile_id = str(profile.get("profileId"))
+                if not profile_id:
+                    return []
+
+                try:
+                    async with semaphore:
+                        result = await self.rate_limiter.execute_with_retry(
+                            list_profile_advertisers, profile_id, isolated=True
+                        )
 
                     # Extract advertisers from response
                     advertisers = result.get("response", [])
@@ -595,14 +631,21 @@ class DSPAMCService:
                         advertiser["profileId"] = profile_id
                         advertiser["countryCode"] = profile.get("countryCode")
 
-                    all_dsp_advertisers.extend(advertisers)
+                    return advertisers
 
                 except Exception as e:
-                    logger.debug(
+                    logger.warning(
                         f"Failed to fetch DSP advertisers for profile {profile_id}: {str(e)}",
                         profile_id=profile_id
                     )
                     # Continue with other profiles
+                    return []
+
+            all_dsp_advertisers = []
+            for advertisers in await asyncio.gather(
+                *(fetch_profile(profile) for profile in profiles)
+            ):
+                all_dsp_advertisers.extend(advertisers)
 
             logger.info(f"Fetched {len(all_dsp_advertisers)} DSP advertisers across {len(profiles)} profiles")
             return all_dsp_advertisers
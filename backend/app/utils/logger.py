@@ -43,6 +43,9 @@ def configure_logging():
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
+        # Calls below log_level return immediately instead of building an
+        # event dict for filter_by_level to drop
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         cache_logger_on_first_use=True,
     )
     
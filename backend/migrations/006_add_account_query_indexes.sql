@@ -0,0 +1,12 @@
+-- Migration: Indexes for server-side account query filters
+-- Date: 2025-09-20
+-- Description: Supports AccountQueryService filters pushed into PostgREST
+
+-- The alternate_ids / country_codes filters are sent as top-level
+-- containment (metadata @> '{"alternate_ids": [...]}'), which the existing
+-- idx_user_accounts_metadata GIN index from 004 serves. Expressions on a
+-- sub-value (metadata->'alternate_ids' @> ...) would not use it.
+
+-- 1. Per-user stale sync lookups (last_synced_at IS NULL OR < cutoff)
+CREATE INDEX IF NOT EXISTS idx_user_accounts_user_last_synced
+ON user_accounts(user_id, last_synced_at);
@@ -0,0 +1,6 @@
+-- Rollback Migration: Remove account query indexes
+-- Date: 2025-09-20
+-- Description: Rollback changes from 006_add_account_query_indexes.sql
+
+-- 1. Drop indexes from user_accounts
+DROP INDEX IF EXISTS idx_user_accounts_user_last_synced;
@@ -0,0 +1,59 @@
+-- Migration: Account statistics aggregate
+-- Date: 2025-09-20
+-- Description: Computes AccountQueryService.get_account_statistics in Postgres
+
+-- 1. Create function returning one row of per-user account statistics
+CREATE OR REPLACE FUNCTION get_account_statistics(
+    p_user_id UUID
+) RETURNS TABLE (
+    total_accounts BIGINT,
+    status_breakdown JSONB,
+    country_coverage TEXT[],
+    profiles_count BIGINT,
+    accounts_with_errors BIGINT,
+    last_sync TIMESTAMP WITH TIME ZONE,
+    oldest_sync TIMESTAMP WITH TIME ZONE,
+    never_synced BIGINT
+) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        COUNT(*) as total_accounts,
+        (
+            SELECT COALESCE(jsonb_object_agg(s.status, s.cnt), '{}'::jsonb)
+            FROM (
+                SELECT ua2.status, COUNT(*) as cnt
+                FROM user_accounts ua2
+                WHERE ua2.user_id = p_user_id
+                GROUP BY ua2.status
+            ) s
+        ) as status_breakdown,
+        ARRAY(
+            SELECT DISTINCT cc
+            FROM user_accounts ua3,
+                jsonb_array_elements_text(ua3.metadata->'country_codes') as cc
+            WHERE ua3.user_id = p_user_id
+                AND jsonb_typeof(ua3.metadata->'country_codes') = 'array'
+            ORDER BY cc
+        ) as country_coverage,
+        COALESCE(SUM(
+            CASE WHEN jsonb_typeof(ua.metadata->'alternate_ids') = 'array'
+                THEN jsonb_array_length(ua.metadata->'alternate_ids')
+                ELSE 0 END
+        ), 0)::BIGINT as profiles_count,
+        COUNT(*) FILTER (
+            WHERE jsonb_typeof(ua.metadata->'errors') IN ('object', 'array')
+                AND ua.metadata->'errors' NOT IN ('{}'::jsonb, '[]'::jsonb)
+        ) as accounts_with_errors,
+        MAX(ua.last_synced_at) as last_sync,
+        MIN(ua.last_synced_at) as oldest_sync,
+        COUNT(*) FILTER (WHERE ua.last_synced_at IS NULL) as never_synced
+    FROM
+        user_accounts ua
+    WHERE
+        ua.user_id = p_user_id;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 2. Grant necessary permissions
+GRANT EXECUTE ON FUNCTION get_account_statistics TO authenticated;
@@ -0,0 +1,6 @@
+-- Rollback Migration: Remove account statistics aggregate
+-- Date: 2025-09-20
+-- Description: Rollback changes from 007_add_account_statistics_function.sql
+
+-- 1. Drop function
+DROP FUNCTION IF EXISTS get_account_statistics(UUID);
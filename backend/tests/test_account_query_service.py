@@ -0,0 +1,236 @@
+"""
+Tests for AccountQueryService server-side filters
+"""
+import pytest
+from datetime import datetime, timezone, timedelta
+from unittest.mock import MagicMock, patch
+from postgrest.exceptions import APIError
+
+from app.services.account_query_service import AccountQueryService, ACCOUNT_COLUMNS
+
+
+def make_row(**overrides):
+    """Build a user_accounts row with every selected column"""
+    row = {
+        "id": "acc-1",
+        "user_id": "user-1",
+        "account_name": "Test Account",
+        "amazon_account_id": "AMZN-1",
+        "marketplace_id": "ATVPDKIKX0DER",
+        "account_type": "advertising",
+        "is_default": False,
+        "status": "active",
+        "metadata": {},
+        "connected_at": "2025-01-01T00:00:00+00:00",
+        "last_synced_at": None,
+    }
+    row.update(overrides)
+    return row
+
+
+class TestAccountQueryService:
+    """Test the PostgREST filters and row handling of AccountQueryService"""
+
+    @pytest.fixture
+    def query_service(self):
+        """Create account query service instance"""
+        return AccountQueryService()
+
+    @pytest.fixture
+    def mock_query(self):
+        """Mock query builder whose filter methods all chain back to itself"""
+        query = MagicMock()
+        for method in ("select", "eq", "in_", "contains", "or_", "is_", "limit"):
+            getattr(query, method).return_value = query
+        query.not_ = query
+        query.execute.return_value.data = []
+        return query
+
+    @pytest.fixture
+    def mock_client(self, query_service, mock_query):
+        """Route the service's Supabase client to the mock query builder"""
+        client = MagicMock()
+        client.table.return_value = mock_query
+        with patch.object(query_service, "_get_client", return_value=client):
+            yield client
+
+    @pytest.mark.asyncio
+    async def test_accounts_by_country_uses_top_level_containment(
+        self, query_service, mock_client, mock_query
+    ):
+        """Test the country filter is metadata @> {...} and matching profiles are attached"""
+        mock_query.execute.return_value.data = [make_row(metadata={
+            "alternate_ids": [
+                {"countryCode": "US", "profileId": 1},
+                {"countryCode": "CA", "profileId": 2}
+            ]
+        })]
+
+        result = await query_service.get_accounts_by_country("user-1", "US")
+
+        mock_query.select.assert_called_once_with(ACCOUNT_COLUMNS)
+        mock_query.eq.assert_called_once_with("user_id", "user-1")
+        mock_query.contains.assert_called_once_with(
+            "metadata", {"alternate_ids": [{"countryCode": "US"}]}
+        )
+        assert result[0]["country_profiles"] == [{"countryCode": "US", "profileId": 1}]
+
+    @pytest.mark.asyncio
+    async def test_profile_id_map_is_cached(self, query_service, mock_client, mock_query):
+        """Test several countries of one account cost a single query"""
+        mock_query.execute.return_value.data = [{"alternate_ids": [
+            {"countryCode": "US", "profileId": 1},
+            {"countryCode": "US", "profileId": 9},
+            {"countryCode": "CA", "profileId": 2}
+        ]}]
+
+        assert await query_service.get_profile_id_for_country("user-1", "AMZN-1", "US") == 1
+        assert await query_service.get_profile_id_for_country("user-1", "AMZN-1", "CA") == 2
+        assert await query_service.get_profile_id_for_country("user-1", "AMZN-1", "MX") is None
+
+        mock_query.select.assert_called_once_with("alternate_ids:metadata->alternate_ids")
+        assert mock_query.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_accounts_with_errors_lists_partial_and_failed_first(
+        self, query_service, mock_client, mock_query
+    ):
+        """Test one not-null errors query, with partial/failed accounts ordered first"""
+        mock_query.execute.return_value.data = [
+            make_row(id="a", status="active", metadata={"errors": {"US": [{"errorId": 1}]}}),
+            make_row(id="b", status="partial", metadata={"errors": {"CA": [{"errorId": 2}]}}),
+            make_row(id="c", status="active", metadata={"errors": {}}),
+            make_row(id="d", status="failed", metadata={"errors": {"MX": [{"errorId": 3}]}}),
+        ]
+
+        result = await query_service.get_accounts_with_errors("user-1")
+
+        mock_query.is_.assert_called_once_with("metadata->errors", "null")
+        assert [a["account_id"] for a in result] == ["b", "d", "a"]
+        assert result[0]["error_countries"] == ["CA"]
+
+    @pytest.mark.asyncio
+    async def test_search_escapes_term_and_filters(self, query_service, mock_client, mock_query):
+        """Test the ilike pattern is quoted and status/country filters are pushed down"""
+        mock_query.execute.return_value.data = [
+            make_row(account_name='Acme "West", Inc'),
+            make_row(account_name="Acme East")
+        ]
+
+        result = await query_service.search_accounts(
+            "user-1",
+            search_term='"West", ',
+            status_filter=["active"],
+            country_filter="US"
+        )
+
+        mock_query.in_.assert_called_once_with("status", ["active"])
+        mock_query.contains.assert_called_once_with("metadata", {"country_codes": ["US"]})
+        pattern = '"*\\"West\\", *"'
+        mock_query.or_.assert_called_once_with(
+            f"account_name.ilike.{pattern},amazon_account_id.ilike.{pattern}"
+        )
+        assert [a["account_name"] for a in result] == ['Acme "West", Inc']
+
+    @pytest.mark.asyncio
+    async def test_accounts_needing_refresh_from_iso_strings(
+        self, query_service, mock_client, mock_query
+    ):
+        """Test stale/never-synced filter and hours_since_sync on raw ISO timestamps"""
+        now = datetime.now(timezone.utc)
+        stale = (now - timedelta(hours=30)).isoformat().replace("+00:00", "Z")
+        fresh = (now - timedelta(hours=1)).isoformat()
+        mock_query.execute.return_value.data = [
+            make_row(id="never", last_synced_at=None),
+            make_row(id="stale", last_synced_at=stale),
+            make_row(id="fresh", last_synced_at=fresh),
+        ]
+
+        result = await query_service.get_accounts_needing_refresh("user-1", hours_threshold=24)
+
+        or_filter = mock_query.or_.call_args.args[0]
+        assert or_filter.startswith("last_synced_at.is.null,last_synced_at.lt.")
+        assert [a["id"] for a in result] == ["never", "stale"]
+        assert "hours_since_sync" not in result[0]
+        assert result[1]["hours_since_sync"] == pytest.approx(30, abs=0.1)
+
+    @pytest.mark.asyncio
+    async def test_statistics_maps_rpc_row(self, query_service, mock_client):
+        """Test the RPC row is returned as-is with NULL aggregates normalised"""
+        mock_client.rpc.return_value.execute.return_value.data = [{
+            "total_accounts": 2,
+            "status_breakdown": None,
+            "country_coverage": None,
+            "profiles_count": 3,
+            "accounts_with_errors": 1,
+            "last_sync": "2025-01-02T00:00:00+00:00",
+            "oldest_sync": "2025-01-01T00:00:00+00:00",
+            "never_synced": 0
+        }]
+
+        stats = await query_service.get_account_statistics("user-1")
+
+        mock_client.rpc.assert_called_once_with("get_account_statistics", {"p_user_id": "user-1"})
+        assert stats["total_accounts"] == 2
+        assert stats["status_breakdown"] == {}
+        assert stats["country_coverage"] == []
+        assert stats["profiles_count"] == 3
+        assert stats["last_sync"] == "2025-01-02T00:00:00+00:00"
+        assert stats["never_synced"] == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("data", [[], [{"total_accounts": 0}]])
+    async def test_statistics_zero_accounts(self, query_service, mock_client, data):
+        """Test an empty or zero-count RPC result gives the zero-account shape"""
+        mock_client.rpc.return_value.execute.return_value.data = data
+
+        stats = await query_service.get_account_statistics("user-1")
+
+        assert stats == {
+            "total_accounts": 0,
+            "status_breakdown": {},
+            "country_coverage": [],
+            "profiles_count": 0,
+            "accounts_with_errors": 0
+        }
+
+    @pytest.mark.asyncio
+    async def test_statistics_falls_back_without_function(
+        self, query_service, mock_client, mock_query
+    ):
+        """Test a missing get_account_statistics function falls back to Python aggregation"""
+        mock_client.rpc.return_value.execute.side_effect = APIError(
+            {"code": "PGRST202", "message": "Could not find the function"}
+        )
+        mock_query.execute.return_value.data = [
+            {"status": "active", "last_synced_at": "2025-01-02T00:00:00Z", "metadata": {
+                "country_codes": ["US", "CA"],
+                "alternate_ids": [{"countryCode": "US"}, {"countryCode": "CA"}]
+            }},
+            {"status": "partial", "last_synced_at": None, "metadata": {
+                "country_codes": ["US"], "errors": {"MX": [{"errorId": 1}]}
+            }},
+        ]
+
+        stats = await query_service.get_account_statistics("user-1")
+
+        assert stats == {
+            "total_accounts": 2,
+            "status_breakdown": {"active": 1, "partial": 1},
+            "country_coverage": ["CA", "US"],
+            "profiles_count": 2,
+            "accounts_with_errors": 1,
+            "last_sync": "2025-01-02T00:00:00+00:00",
+            "oldest_sync": "2025-01-02T00:00:00+00:00",
+            "never_synced": 1
+        }
+
+    @pytest.mark.asyncio
+    async def test_statistics_other_rpc_errors_propagate(self, query_service, mock_client):
+        """Test RPC errors other than a missing function are not masked"""
+        mock_client.rpc.return_value.execute.side_effect = APIError(
+            {"code": "42501", "message": "permission denied"}
+        )
+
+        with pytest.raises(APIError):
+            await query_service.get_account_statistics("user-1")
@@ -354,6 +354,95 @@ class TestAccountSyncIntegration:
                 # If there's a datetime parsing error, that's also a valid test result
                 assert "error" in result
 
+    @pytest.mark.asyncio
+    async def test_process_accounts_uses_bulk_upsert(
+        self, sync_service, mock_supabase_client, mock_api_accounts_response
+    ):
+        """Test stored rows are upserted and new rows inserted, in bulk per type"""
+        user_id = str(uuid4())
+        existing_id = str(uuid4())
+        sync_service.supabase = mock_supabase_client
+
+        mock_table = mock_supabase_client.table.return_value
+        mock_table.order.return_value = mock_table
+        mock_table.range.return_value.execute.return_value.data = [{
+            "id": existing_id,
+            "amazon_account_id": "AMZN-ADV-SYNC-001",
+            "connected_at": "2025-01-01T00:00:00+00:00",
+            "metadata": {"custom_flag": True}
+        }]
+        mock_table.upsert.return_value.execute.return_value.data = [{"id": existing_id}]
+        mock_table.insert.return_value.execute.return_value.data = [{"id": str(uuid4())}]
+
+        result = await sync_service._process_all_account_types(user_id, {
+            "advertising_accounts": mock_api_accounts_response["adsAccounts"],
+            "dsp_advertisers": [],
+            "amc_instances": []
+        })
+
+        assert result["total"] == 2
+        assert result["created"] == 1
+        assert result["updated"] == 1
+        assert result["failed"] == 0
+        mock_table.order.assert_called_once_with("id")
+        mock_table.upsert.assert_called_once()
+        mock_table.insert.assert_called_once()
+        mock_table.update.assert_not_called()
+
+        rows = mock_table.upsert.call_args.args[0]
+        assert mock_table.upsert.call_args.kwargs["on_conflict"] == "user_id,amazon_account_id"
+        assert [row["id"] for row in rows] == [existing_id]
+        assert rows[0]["connected_at"] == "2025-01-01T00:00:00+00:00"
+        assert rows[0]["metadata"]["custom_flag"] is True
+
+        # New rows leave id and connected_at to the database defaults
+        new_rows = mock_table.insert.call_args.args[0]
+        assert [row["amazon_account_id"] for row in new_rows] == ["AMZN-ADV-SYNC-002"]
+        assert "id" not in new_rows[0]
+        assert "connected_at" not in new_rows[0]
+
+    @pytest.mark.asyncio
+    async def test_process_accounts_failed_chunk_falls_back_per_row(
+        self, sync_service, mock_supabase_client, mock_api_accounts_response
+    ):
+        """Test a failing bulk write is retried row by row and missing IDs are rejected"""
+        user_id = str(uuid4())
+        sync_service.supabase = mock_supabase_client
+
+        mock_table = mock_supabase_client.table.return_value
+        mock_table.order.return_value = mock_table
+        mock_table.range.return_value.execute.return_value.data = []
+        mock_table.insert.return_value.execute.side_effect = Exception("bulk insert failed")
+
+        saved = []
+
+        def save_row(save_user_id, row):
+            if row["amazon_account_id"] == "AMZN-ADV-SYNC-002":
+                raise Exception("bad row")
+            saved.append(row["amazon_account_id"])
+            return (True, True)
+
+        accounts = mock_api_accounts_response["adsAccounts"] + [
+            {"accountName": "No ID", "status": "CREATED", "alternateIds": []}
+        ]
+        with patch.object(sync_service, "_save_account_row", side_effect=save_row):
+            result = await sync_service._process_all_account_types(user_id, {
+                "advertising_accounts": accounts,
+                "dsp_advertisers": [],
+                "amc_instances": []
+            })
+
+        assert result["total"] == 3
+        assert result["created"] == 1
+        assert result["failed"] == 2
+        assert saved == ["AMZN-ADV-SYNC-001"]
+        mock_table.insert.assert_called_once()
+        assert len(mock_table.insert.call_args.args[0]) == 2
+        assert {e["account_id"]: e["error"] for e in result["errors"]} == {
+            None: "Missing adsAccountId",
+            "AMZN-ADV-SYNC-002": "bad row"
+        }
+
     def test_sync_service_dependency_injection(self, sync_service):
         """Test that sync service properly handles dependency injection"""
         # Check that service has necessary attributes
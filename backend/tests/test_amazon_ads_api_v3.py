@@ -7,7 +7,7 @@ import httpx
 from unittest.mock import AsyncMock, MagicMock, patch, call
 from datetime import datetime, timezone, timedelta
 
-from app.services.account_service import account_service
+from app.services.account_service import account_service, decode_error_body
 from app.api.v1.accounts import list_amazon_ads_accounts
 from app.core.exceptions import TokenRefreshError, RateLimitError
 
@@ -74,7 +74,7 @@ class TestAmazonAdsAPIv3:
     async def test_list_ads_accounts_parses_v3_response(self, mock_api_v3_response):
         """Test that list_ads_accounts correctly parses API v3.0 response"""
 
-        with patch('httpx.AsyncClient') as mock_client:
+        with patch.object(account_service, '_get_http_client') as mock_client:
             # Setup mock response
             mock_response = MagicMock()
             mock_response.status_code = 200
@@ -83,7 +83,7 @@ class TestAmazonAdsAPIv3:
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             # Call the service method
             result = await account_service._list_ads_accounts_raw("test_token")
@@ -189,7 +189,7 @@ class TestAmazonAdsAPIv3:
     @pytest.mark.asyncio
     async def test_post_endpoint_with_correct_headers(self, mock_access_token):
         """Test that POST /adsAccounts/list is called with correct headers"""
-        with patch('httpx.AsyncClient') as mock_client:
+        with patch.object(account_service, '_get_http_client') as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"adsAccounts": [], "nextToken": None}
@@ -197,7 +197,7 @@ class TestAmazonAdsAPIv3:
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             # Call the service method
             await account_service._list_ads_accounts_raw(mock_access_token)
@@ -225,7 +225,7 @@ class TestAmazonAdsAPIv3:
         """Test pagination handling with nextToken parameter"""
         next_token = "eyJjdXJzb3IiOiAiMjAyNS0wMS0xNCJ9"
 
-        with patch('httpx.AsyncClient') as mock_client:
+        with patch.object(account_service, '_get_http_client') as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"adsAccounts": [], "nextToken": None}
@@ -233,7 +233,7 @@ class TestAmazonAdsAPIv3:
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             # Call with nextToken
             await account_service._list_ads_accounts_raw(mock_access_token, next_token)
@@ -248,7 +248,7 @@ class TestAmazonAdsAPIv3:
     @pytest.mark.asyncio
     async def test_handle_rate_limit_429(self, mock_access_token):
         """Test handling of 429 rate limit response"""
-        with patch('httpx.AsyncClient') as mock_client:
+        with patch.object(account_service, '_get_http_client') as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 429
             mock_response.headers = {"Retry-After": "30"}
@@ -256,7 +256,7 @@ class TestAmazonAdsAPIv3:
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             # Should raise RateLimitError
             with pytest.raises(Exception) as exc_info:
@@ -269,14 +269,14 @@ class TestAmazonAdsAPIv3:
     @pytest.mark.asyncio
     async def test_handle_401_unauthorized(self, mock_access_token):
         """Test handling of 401 unauthorized (expired token)"""
-        with patch('httpx.AsyncClient') as mock_client:
+        with patch.object(account_service, '_get_http_client') as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 401
             mock_response.text = '{"message": "Unauthorized"}'
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             # Should raise TokenRefreshError
             with pytest.raises(TokenRefreshError) as exc_info:
@@ -287,14 +287,14 @@ class TestAmazonAdsAPIv3:
     @pytest.mark.asyncio
     async def test_handle_403_forbidden(self, mock_access_token):
         """Test handling of 403 forbidden (insufficient permissions)"""
-        with patch('httpx.AsyncClient') as mock_client:
+        with patch.object(account_service, '_get_http_client') as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 403
             mock_response.text = '{"message": "Forbidden"}'
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             # Should raise permission error
             with pytest.raises(Exception) as exc_info:
@@ -305,10 +305,10 @@ class TestAmazonAdsAPIv3:
     @pytest.mark.asyncio
     async def test_handle_timeout_exception(self, mock_access_token):
         """Test handling of request timeout"""
-        with patch('httpx.AsyncClient') as mock_client:
+        with patch.object(account_service, '_get_http_client') as mock_client:
             mock_client_instance = AsyncMock()
             mock_client_instance.post.side_effect = httpx.TimeoutException("Request timeout")
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             # Should raise timeout exception
             with pytest.raises(Exception) as exc_info:
@@ -400,7 +400,7 @@ class TestAmazonAdsAPIv3:
     @pytest.mark.asyncio
     async def test_empty_response_handling(self, mock_access_token):
         """Test handling of empty accounts response"""
-        with patch('httpx.AsyncClient') as mock_client:
+        with patch.object(account_service, '_get_http_client') as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"adsAccounts": [], "nextToken": None}
@@ -408,7 +408,7 @@ class TestAmazonAdsAPIv3:
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             result = await account_service._list_ads_accounts_raw(mock_access_token)
 
@@ -445,6 +445,12 @@ class TestAmazonAdsAPIv3:
             mock_retry.assert_called_once()
             assert result["adsAccounts"] == []
 
+    def test_decode_error_body(self):
+        """Test error bodies decode from JSON, fall back to text, and tolerate empty bodies"""
+        assert decode_error_body(httpx.Response(500, content=b'{"code": "X"}')) == {"code": "X"}
+        assert decode_error_body(httpx.Response(502, content=b"Bad Gateway")) == "Bad Gateway"
+        assert decode_error_body(httpx.Response(503)) == {}
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
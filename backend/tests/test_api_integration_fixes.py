@@ -388,4 +388,208 @@ class TestProfilesAPIPaginationFix:
             assert "profiles" in result
             assert len(result["profiles"]) == 2
             assert "nextToken" in result
-            assert result["nextToken"] == "next_page_token"
\ No newline at end of file
+            assert result["nextToken"] == "next_page_token"
+
+    @pytest.mark.asyncio
+    async def test_profiles_listing_is_cached_and_coalesced(self, account_service):
+        """Test concurrent and repeated profile listings share one upstream call"""
+        import asyncio
+
+        response = {"profiles": [{"profileId": "1"}], "nextToken": None}
+        with patch.object(
+            account_service, '_list_profiles_raw', AsyncMock(return_value=response)
+        ) as mock_raw:
+            first, second = await asyncio.gather(
+                account_service.list_profiles("test_token"),
+                account_service.list_profiles("test_token")
+            )
+            third = await account_service.list_profiles("test_token")
+            await account_service.list_profiles("other_token")
+
+        assert first == second == third == response
+        assert mock_raw.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_profile_cache_and_bypass(self, account_service):
+        """Test get_profile is cached per profile and use_cache=False refetches"""
+        with patch.object(
+            account_service, '_get_profile_raw',
+            AsyncMock(side_effect=lambda token, pid: {"profileId": pid})
+        ) as mock_raw:
+            await account_service.get_profile("test_token", "1")
+            await account_service.get_profile("test_token", "1")
+            await account_service.get_profile("test_token", "2")
+            assert mock_raw.await_count == 2
+
+            # Sync paths bypass the cache and refresh it with what they fetched
+            await account_service.get_profile("test_token", "1", use_cache=False)
+            assert mock_raw.await_count == 3
+            await account_service.get_profile("test_token", "1")
+            assert mock_raw.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_profile_cache_disabled_with_zero_ttl(self, account_service):
+        """Test amazon_profiles_cache_ttl=0 turns the profile cache off"""
+        with patch.object(settings, 'amazon_profiles_cache_ttl', 0), \
+                patch.object(
+                    account_service, '_get_profile_raw',
+                    AsyncMock(return_value={"profileId": "1"})
+                ) as mock_raw:
+            await account_service.get_profile("test_token", "1")
+            await account_service.get_profile("test_token", "1")
+
+        assert mock_raw.await_count == 2
+
+
+class TestTransientErrorRetries:
+    """Test 5xx / timeout / network failures are retried and 4xx are not"""
+
+    @pytest.fixture
+    def account_service(self):
+        """Create AmazonAccountService instance"""
+        return AmazonAccountService()
+
+    @pytest.fixture
+    def mock_http(self, account_service):
+        """Patch the pooled HTTP client and backoff sleeps"""
+        client = AsyncMock()
+        with patch.object(account_service, '_get_http_client', return_value=client), \
+                patch('asyncio.sleep', new_callable=AsyncMock):
+            yield client
+
+    @staticmethod
+    def _response(status_code, body=b""):
+        response = Mock()
+        response.status_code = status_code
+        response.content = body
+        response.headers = {}
+        return response
+
+    @pytest.mark.asyncio
+    async def test_5xx_retried_up_to_transient_cap(self, account_service, mock_http):
+        """Test a persistent 503 is attempted max_transient_retries times"""
+        mock_http.get.return_value = self._response(503, b'{"code": "UNAVAILABLE"}')
+
+        with pytest.raises(Exception) as exc_info:
+            await account_service.list_profiles("test_token")
+
+        assert "API Error: 503" in str(exc_info.value)
+        assert mock_http.get.await_count == account_service.rate_limiter.max_transient_retries
+
+    @pytest.mark.asyncio
+    async def test_5xx_then_success(self, account_service, mock_http):
+        """Test a single 503 is retried and the next success is returned"""
+        success = self._response(200)
+        success.json.return_value = {"profileId": "1"}
+        mock_http.get.side_effect = [self._response(503), success]
+
+        profile = await account_service.get_profile("test_token", "1")
+
+        assert profile == {"profileId": "1"}
+        assert mock_http.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_timeout_retried(self, account_service, mock_http):
+        """Test timeouts become TransientAPIError and are retried"""
+        mock_http.get.side_effect = httpx.ReadTimeout("timed out")
+
+        with pytest.raises(Exception, match="Request timeout"):
+            await account_service.get_profile("test_token", "1")
+
+        assert mock_http.get.await_count == account_service.rate_limiter.max_transient_retries
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status_code", [400, 403, 404])
+    async def test_4xx_not_retried(self, account_service, mock_http, status_code):
+        """Test client errors fail on the first attempt"""
+        mock_http.get.return_value = self._response(status_code)
+
+        with pytest.raises(Exception):
+            await account_service.get_profile("test_token", "1")
+
+        assert mock_http.get.await_count == 1
+
+
+class TestRetryAfterHandling:
+    """Test 429 retries wait exactly Retry-After, or back off without it"""
+
+    @pytest.fixture
+    def account_service(self):
+        """Create AmazonAccountService instance"""
+        return AmazonAccountService()
+
+    @staticmethod
+    def _rate_limited(retry_after=None):
+        response = Mock()
+        response.status_code = 429
+        response.content = b""
+        response.headers = {"Retry-After": retry_after} if retry_after else {}
+        return response
+
+    async def _sleeps_for(self, account_service, responses):
+        """Run list_profiles against the responses and return the backoff sleeps"""
+        client = AsyncMock()
+        client.get.side_effect = responses
+        with patch.object(account_service, '_get_http_client', return_value=client), \
+                patch.object(account_service.rate_limiter, '_check_rate_limit', AsyncMock()), \
+                patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            try:
+                await account_service.list_profiles("test_token")
+            except Exception:
+                pass
+        return [c.args[0] for c in mock_sleep.call_args_list], client.get.await_count
+
+    @pytest.mark.asyncio
+    async def test_retry_after_seconds_used_exactly(self, account_service):
+        """Test the sleep is Retry-After plus at most 0.5s of jitter"""
+        success = Mock(status_code=200, headers={})
+        success.json.return_value = {"profiles": [], "nextToken": None}
+
+        sleeps, attempts = await self._sleeps_for(
+            account_service, [self._rate_limited("7"), success]
+        )
+
+        assert attempts == 2
+        assert len(sleeps) == 1
+        assert 7 <= sleeps[0] <= 7.5
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("retry_after", [None, "Wed, 21 Oct 2015 07:28:00 GMT"])
+    async def test_missing_or_date_retry_after_backs_off(self, account_service, retry_after):
+        """Test absent or HTTP-date Retry-After uses capped backoff, not an invented 60s"""
+        limiter = account_service.rate_limiter
+
+        sleeps, attempts = await self._sleeps_for(
+            account_service, [self._rate_limited(retry_after)] * 5
+        )
+
+        # Attempts are capped at 3, so two backoff sleeps in between
+        assert attempts == 3
+        assert len(sleeps) == 2
+        for attempt, delay in enumerate(sleeps):
+            base = limiter.base_delay * (2 ** attempt)
+            assert base <= delay <= min(base + 1, limiter.max_delay)
+
+    @pytest.mark.asyncio
+    async def test_exhausted_429_does_not_block_other_users(self, account_service):
+        """Test profile calls skip the shared throttle and never open the circuit breaker"""
+        limiter = account_service.rate_limiter
+        profile = Mock(status_code=200, headers={})
+        profile.json.return_value = {"profileId": "1"}
+        client = AsyncMock()
+        client.get.side_effect = [self._rate_limited("1")] * limiter.max_retries + [profile]
+
+        with patch.object(account_service, '_get_http_client', return_value=client), \
+                patch.object(limiter, '_check_rate_limit', AsyncMock()) as mock_throttle, \
+                patch('asyncio.sleep', new_callable=AsyncMock):
+            with pytest.raises(Exception, match="Rate limit exceeded"):
+                await account_service.list_profiles("user_a_token")
+
+            assert limiter.circuit_open is False
+            assert limiter.consecutive_failures == 0
+
+            # Another user's call still reaches Amazon
+            assert await account_service.get_profile("user_b_token", "1") == {"profileId": "1"}
+
+        mock_throttle.assert_not_called()
+        assert client.get.await_count == limiter.max_retries + 1
@@ -1,6 +1,7 @@
 """
 Test Clerk authentication integration
 """
+import asyncio
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime, timedelta
@@ -287,6 +288,7 @@ class TestClerkAuthMiddleware:
     @pytest.mark.asyncio
     async def test_authenticate_request_with_cookie(self, middleware, mock_request):
         """Test authenticating request with session cookie"""
+        mock_request.headers["cookie"] = "__session=cookie_token"
         mock_request.cookies["__session"] = "cookie_token"
         
         with patch.object(ClerkService, 'verify_session_token') as mock_verify:
@@ -304,9 +306,87 @@ class TestClerkAuthMiddleware:
     async def test_authenticate_request_no_credentials(self, middleware, mock_request):
         """Test authenticating request with no credentials"""
         user = await middleware.authenticate_request(mock_request)
-        
+
         assert user is None
-    
+
+    @pytest.mark.asyncio
+    async def test_authenticate_request_caches_verified_token(self, middleware, mock_request):
+        """Test repeated requests with the same token skip re-verification"""
+        mock_request.headers["Authorization"] = "Bearer cached_token"
+
+        with patch.object(ClerkService, 'verify_session_token') as mock_verify:
+            mock_verify.return_value = {
+                "sub": "user_cached",
+                "email": "cached@example.com",
+                "exp": (datetime.utcnow() + timedelta(hours=1)).timestamp()
+            }
+
+            first = await middleware.authenticate_request(mock_request)
+            second = await middleware.authenticate_request(mock_request)
+
+            assert first["sub"] == second["sub"] == "user_cached"
+            assert mock_verify.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_ensure_user_exists_caches_user_and_debounces_login(self, middleware):
+        """Test repeated lookups reuse the cached user and write last login once"""
+        from app.models.user import User
+        from app.services.user_service import UserService
+
+        user = User(clerk_user_id="user_debounce", email="debounce@example.com")
+
+        with patch.object(UserService, 'get_user_by_clerk_id', new_callable=AsyncMock) as mock_get, \
+             patch.object(UserService, 'update_last_login', new_callable=AsyncMock) as mock_login:
+            mock_get.return_value = user
+
+            first = await middleware.ensure_user_exists({"sub": "user_debounce"})
+            second = await middleware.ensure_user_exists({"sub": "user_debounce"})
+            await asyncio.sleep(0)
+
+            assert first == second
+            assert first["email"] == "debounce@example.com"
+            assert mock_get.call_count == 1
+            assert mock_login.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_authenticate_request_prefetches_user(self, middleware, mock_request):
+        """Test the user row is fetched alongside token verification"""
+        from app.models.user import User
+        from app.services.user_service import UserService
+
+        token = jwt.encode({"sub": "user_prefetch"}, "secret", algorithm="HS256")
+        mock_request.headers["Authorization"] = f"Bearer {token}"
+        user = User(clerk_user_id="user_prefetch", email="prefetch@example.com")
+
+        with patch.object(ClerkService, 'verify_session_token', new_callable=AsyncMock) as mock_verify, \
+             patch.object(UserService, 'get_user_by_clerk_id', new_callable=AsyncMock) as mock_get, \
+             patch.object(UserService, 'update_last_login', new_callable=AsyncMock):
+            mock_verify.return_value = {"sub": "user_prefetch"}
+            mock_get.return_value = user
+
+            result = await middleware.authenticate_request(mock_request)
+
+            assert result["user_id"] == user.id
+            assert mock_get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_authentication_required_response(self):
+        """Test the pre-encoded 401 body matches the structured error format"""
+        from app.core.exceptions import AuthenticationRequiredError
+        from app.middleware.error_handler import http_exception_handler
+
+        request = Mock()
+        request.url.path = "/api/v1/users/me"
+
+        response = await http_exception_handler(request, AuthenticationRequiredError())
+        body = json.loads(response.body)
+
+        assert response.status_code == 401
+        assert response.headers["www-authenticate"] == "Bearer"
+        assert body["error"]["code"] == "HTTP_401"
+        assert body["error"]["message"] == "Authentication required"
+        assert body["error"]["timestamp"]
+
     def test_extract_token_from_header(self, middleware):
         """Test extracting token from Authorization header"""
         # Test Bearer token
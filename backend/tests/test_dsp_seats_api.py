@@ -32,9 +32,9 @@ async def test_list_advertiser_seats_success():
         "nextToken": None
     }
 
-    with patch("httpx.AsyncClient") as mock_client:
+    with patch.object(dsp_amc_service, "_get_http_client") as mock_client:
         mock_instance = AsyncMock()
-        mock_client.return_value.__aenter__.return_value = mock_instance
+        mock_client.return_value = mock_instance
 
         mock_post = MagicMock()
         mock_post.status_code = 200
@@ -80,9 +80,9 @@ async def test_list_advertiser_seats_with_filters():
         "nextToken": "eyJsYXN0S2V5IjoiMTIzIn0="
     }
 
-    with patch("httpx.AsyncClient") as mock_client:
+    with patch.object(dsp_amc_service, "_get_http_client") as mock_client:
         mock_instance = AsyncMock()
-        mock_client.return_value.__aenter__.return_value = mock_instance
+        mock_client.return_value = mock_instance
 
         mock_post = MagicMock()
         mock_post.status_code = 200
@@ -115,9 +115,9 @@ async def test_list_advertiser_seats_with_filters():
 @pytest.mark.asyncio
 async def test_list_advertiser_seats_token_expired():
     """Test handling of expired token (401 response)"""
-    with patch("httpx.AsyncClient") as mock_client:
+    with patch.object(dsp_amc_service, "_get_http_client") as mock_client:
         mock_instance = AsyncMock()
-        mock_client.return_value.__aenter__.return_value = mock_instance
+        mock_client.return_value = mock_instance
 
         mock_post = MagicMock()
         mock_post.status_code = 401
@@ -135,9 +135,9 @@ async def test_list_advertiser_seats_token_expired():
 @pytest.mark.asyncio
 async def test_list_advertiser_seats_insufficient_permissions():
     """Test handling of insufficient permissions (403 response)"""
-    with patch("httpx.AsyncClient") as mock_client:
+    with patch.object(dsp_amc_service, "_get_http_client") as mock_client:
         mock_instance = AsyncMock()
-        mock_client.return_value.__aenter__.return_value = mock_instance
+        mock_client.return_value = mock_instance
 
         mock_post = MagicMock()
         mock_post.status_code = 403
@@ -159,9 +159,9 @@ async def test_list_advertiser_seats_insufficient_permissions():
 @pytest.mark.asyncio
 async def test_list_advertiser_seats_rate_limit_exceeded():
     """Test handling of rate limit exceeded (429 response)"""
-    with patch("httpx.AsyncClient") as mock_client:
+    with patch.object(dsp_amc_service, "_get_http_client") as mock_client:
         mock_instance = AsyncMock()
-        mock_client.return_value.__aenter__.return_value = mock_instance
+        mock_client.return_value = mock_instance
 
         mock_post = MagicMock()
         mock_post.status_code = 429
@@ -180,13 +180,13 @@ async def test_list_advertiser_seats_rate_limit_exceeded():
 @pytest.mark.asyncio
 async def test_list_advertiser_seats_invalid_advertiser():
     """Test handling of invalid advertiser ID (400 response)"""
-    with patch("httpx.AsyncClient") as mock_client:
+    with patch.object(dsp_amc_service, "_get_http_client") as mock_client:
         mock_instance = AsyncMock()
-        mock_client.return_value.__aenter__.return_value = mock_instance
+        mock_client.return_value = mock_instance
 
         mock_post = MagicMock()
         mock_post.status_code = 400
-        mock_post.text = '{"errors": [{"errorCode": "INVALID_ADVERTISER", "errorMessage": "Advertiser ID not found"}]}'
+        mock_post.content = b'{"errors": [{"errorCode": "INVALID_ADVERTISER", "errorMessage": "Advertiser ID not found"}]}'
         mock_post.json = MagicMock(return_value={
             "errors": [{"errorCode": "INVALID_ADVERTISER", "errorMessage": "Advertiser ID not found"}]
         })
@@ -204,9 +204,9 @@ async def test_list_advertiser_seats_invalid_advertiser():
 @pytest.mark.asyncio
 async def test_list_advertiser_seats_timeout():
     """Test handling of request timeout"""
-    with patch("httpx.AsyncClient") as mock_client:
+    with patch.object(dsp_amc_service, "_get_http_client") as mock_client:
         mock_instance = AsyncMock()
-        mock_client.return_value.__aenter__.return_value = mock_instance
+        mock_client.return_value = mock_instance
 
         mock_instance.post.side_effect = httpx.TimeoutException("Request timeout")
 
@@ -222,9 +222,9 @@ async def test_list_advertiser_seats_timeout():
 @pytest.mark.asyncio
 async def test_list_advertiser_seats_network_error():
     """Test handling of network errors"""
-    with patch("httpx.AsyncClient") as mock_client:
+    with patch.object(dsp_amc_service, "_get_http_client") as mock_client:
         mock_instance = AsyncMock()
-        mock_client.return_value.__aenter__.return_value = mock_instance
+        mock_client.return_value = mock_instance
 
         mock_instance.post.side_effect = httpx.RequestError("Network error")
 
@@ -240,9 +240,9 @@ async def test_list_advertiser_seats_network_error():
 @pytest.mark.asyncio
 async def test_list_advertiser_seats_max_results_boundary():
     """Test that max_results is capped at 200"""
-    with patch("httpx.AsyncClient") as mock_client:
+    with patch.object(dsp_amc_service, "_get_http_client") as mock_client:
         mock_instance = AsyncMock()
-        mock_client.return_value.__aenter__.return_value = mock_instance
+        mock_client.return_value = mock_instance
 
         mock_post = MagicMock()
         mock_post.status_code = 200
@@ -269,9 +269,9 @@ async def test_list_advertiser_seats_empty_response():
         "nextToken": None
     }
 
-    with patch("httpx.AsyncClient") as mock_client:
+    with patch.object(dsp_amc_service, "_get_http_client") as mock_client:
         mock_instance = AsyncMock()
-        mock_client.return_value.__aenter__.return_value = mock_instance
+        mock_client.return_value = mock_instance
 
         mock_post = MagicMock()
         mock_post.status_code = 200
@@ -290,13 +290,13 @@ async def test_list_advertiser_seats_empty_response():
 @pytest.mark.asyncio
 async def test_list_advertiser_seats_server_error():
     """Test handling of server errors (500 response)"""
-    with patch("httpx.AsyncClient") as mock_client:
+    with patch.object(dsp_amc_service, "_get_http_client") as mock_client:
         mock_instance = AsyncMock()
-        mock_client.return_value.__aenter__.return_value = mock_instance
+        mock_client.return_value = mock_instance
 
         mock_post = MagicMock()
         mock_post.status_code = 500
-        mock_post.text = '{"errors": [{"errorCode": "INTERNAL_ERROR", "errorMessage": "Internal server error"}]}'
+        mock_post.content = b'{"errors": [{"errorCode": "INTERNAL_ERROR", "errorMessage": "Internal server error"}]}'
         mock_post.json = MagicMock(return_value={
             "errors": [{"errorCode": "INTERNAL_ERROR", "errorMessage": "Internal server error"}]
         })
@@ -308,4 +308,79 @@ async def test_list_advertiser_seats_server_error():
                 advertiser_id="DSP123"
             )
 
-        assert "API Error: 500" in str(exc_info.value)
\ No newline at end of file
+        assert "API Error: 500" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_dsp_advertisers_fans_out_across_profiles():
+    """Test advertisers from every profile are merged in profile order, skipping failures"""
+    profiles = {"profiles": [
+        {"profileId": 1, "countryCode": "US"},
+        {"profileId": 2, "countryCode": "CA"},
+        {"profileId": 3, "countryCode": "MX"}
+    ]}
+
+    async def list_dsp_advertisers(access_token, profile_id, count):
+        if profile_id == "2":
+            raise Exception("API Error: 500")
+        return {"totalResults": 1, "response": [{"advertiserId": f"ADV{profile_id}"}]}
+
+    with patch(
+        "app.services.account_service.account_service.list_profiles",
+        AsyncMock(return_value=profiles)
+    ), patch.object(dsp_amc_service, "list_dsp_advertisers", side_effect=list_dsp_advertisers):
+        advertisers = await dsp_amc_service._fetch_all_dsp_advertisers("test_token")
+
+    assert [a["advertiserId"] for a in advertisers] == ["ADV1", "ADV3"]
+    assert advertisers[0]["profileId"] == "1"
+    assert advertisers[1]["countryCode"] == "MX"
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_dsp_advertisers_retries_rate_limited_profile():
+    """Test a 429 on one profile is retried after Retry-After instead of dropped"""
+    profiles = {"profiles": [{"profileId": 1, "countryCode": "US"}]}
+    calls = []
+
+    async def list_dsp_advertisers(access_token, profile_id, count):
+        calls.append(profile_id)
+        if len(calls) == 1:
+            raise RateLimitError(2)
+        return {"totalResults": 1, "response": [{"advertiserId": "ADV1"}]}
+
+    with patch(
+        "app.services.account_service.account_service.list_profiles",
+        AsyncMock(return_value=profiles)
+    ), patch.object(dsp_amc_service, "list_dsp_advertisers", side_effect=list_dsp_advertisers), \
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        advertisers = await dsp_amc_service._fetch_all_dsp_advertisers("test_token")
+
+    assert [a["advertiserId"] for a in advertisers] == ["ADV1"]
+    assert calls == ["1", "1"]
+    assert 2 <= mock_sleep.call_args.args[0] <= 2.5
+
+
+@pytest.mark.asyncio
+async def test_list_all_account_types_use_cache_false_refetches():
+    """Test sync callers bypass the cached account and profile listings"""
+    from app.services.account_service import AmazonAccountService
+
+    service = AmazonAccountService()
+    ads_raw = AsyncMock(return_value={"adsAccounts": [], "nextToken": None})
+    profiles_raw = AsyncMock(return_value={"profiles": [], "nextToken": None})
+
+    with patch("app.services.account_service.account_service", service), \
+            patch.object(service, "_list_ads_accounts_raw", ads_raw), \
+            patch.object(service, "_list_profiles_raw", profiles_raw), \
+            patch.object(service.rate_limiter, "_check_rate_limit", AsyncMock()):
+        for _ in range(2):
+            await dsp_amc_service.list_all_account_types("test_token", include_amc=False)
+        assert ads_raw.await_count == 1
+        assert profiles_raw.await_count == 1
+
+        for _ in range(2):
+            await dsp_amc_service.list_all_account_types(
+                "test_token", include_amc=False, use_cache=False
+            )
+        assert ads_raw.await_count == 3
+        assert profiles_raw.await_count == 3
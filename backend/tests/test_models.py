@@ -10,6 +10,7 @@ from app.models.user import User
 from app.models.amazon_account import AmazonAccount
 from app.schemas.user import UserCreate, UserUpdate, UserResponse
 from app.schemas.amazon_account import AmazonAccountCreate, AmazonAccountResponse
+from app.schemas.account_types import AccountRelationship
 
 
 class TestUserModel:
@@ -259,4 +260,50 @@ class TestUserAccountRelationship:
         
         # Count default accounts
         default_count = sum(1 for acc in accounts if acc.is_default)
-        assert default_count == 1
\ No newline at end of file
+        assert default_count == 1
+
+
+class TestAccountTypeResponses:
+    """Test account type response schemas"""
+    
+    def test_from_row_builds_without_validation(self):
+        """Test trusted rows are wrapped as-is with field defaults applied"""
+        account = AmazonAccountResponse.from_row({
+            "id": str(uuid4()),
+            "user_id": str(uuid4()),
+            "account_name": "Trusted Account",
+            "amazon_account_id": "amzn_trusted",
+            "connected_at": "2025-01-15T10:30:00+00:00"
+        })
+        
+        assert account.account_name == "Trusted Account"
+        assert account.last_synced_at is None
+        assert account.metadata == {}
+        assert account.status == "active"
+        assert account.account_type == "advertising"
+    
+    def test_from_row_passes_iso_timestamps_through(self):
+        """Test from_row keeps ISO timestamp strings and formats datetimes"""
+        account = AmazonAccountResponse.from_row({
+            "id": str(uuid4()),
+            "user_id": str(uuid4()),
+            "account_name": "Row Account",
+            "amazon_account_id": "amzn_row",
+            "connected_at": "2025-01-15T10:30:00+00:00",
+            "last_synced_at": datetime(2025, 1, 16, 8, 0)
+        })
+        
+        assert account.connected_at == "2025-01-15T10:30:00+00:00"
+        assert account.last_synced_at == "2025-01-16T08:00:00"
+        assert account.status == "active"
+    
+    def test_relationship_rejects_self_reference(self):
+        """Test an account cannot be related to itself"""
+        account_id = str(uuid4())
+        
+        with pytest.raises(ValueError):
+            AccountRelationship(
+                parent_account_id=account_id,
+                child_account_id=account_id,
+                relationship_type="sponsored_to_dsp"
+            )